@@ -1,22 +1,115 @@
-from typing import List, Union, Optional, Tuple
-from astrbot import logger
-from astrbot.api.event import AstrMessageEvent, MessageChain
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from astrbot.api.event import AstrMessageEvent
 from ..services.category_manager import CategoryManager
 from ..services.file_manager import FileManager
-from ..utils.types import CategoryType, FilePath, MessageResponse
+from ..utils.types import CategoryType, MessageResponse
 from ..utils.exceptions import (
     CategoryNotFoundError,
     CategoryDeleteError,
     FileNotFoundError,
     FileDeleteError,
-    MultipleFilesFoundError
+    MultipleFilesFoundError,
+    LitematicPluginError
 )
 from ..utils.logging_utils import log_error, log_operation
 
+# 删除命令中可预期异常到用户提示的映射
+_ERROR_FORMATTERS: Dict[Type[LitematicPluginError], Callable[[LitematicPluginError], str]] = {
+    MultipleFilesFoundError: lambda e: "找到多个匹配的文件，请指定完整文件名：\n- " + "\n- ".join(
+        e.details.get("matches", [])
+    ),
+    FileNotFoundError: lambda e: e.message,
+    CategoryNotFoundError: lambda e: e.message,
+    FileDeleteError: lambda e: f"删除文件失败: {e.message}",
+    CategoryDeleteError: lambda e: f"删除分类失败: {e.message}",
+}
+
+def _clone_exception(error: BaseException) -> BaseException:
+    """复制异常对象，保留类型、参数和属性，原异常作为__cause__
+    
+    整批删除失败时每个等待方都要抛出异常，共用同一个异常对象会让各自的堆栈累积到同一个
+    __traceback__上；插件异常的构造参数与args不一致，不能用copy.copy重新构造。
+    
+    Args:
+        error: 原异常
+        
+    Returns:
+        BaseException: 新的异常对象
+    """
+    clone = type(error).__new__(type(error), *error.args)
+    clone.__dict__.update(error.__dict__)
+    clone.__cause__ = error
+    return clone
+
+
+class _DeleteCoalescer:
+    """合并并发的删除文件请求，按分类批量删除
+    
+    单个请求立即执行，不额外等待；前一批在线程池中执行期间到达的请求会合并为下一批，
+    同一分类的多个文件只扫描一次目录。
+    """
+    
+    def __init__(self, file_manager: FileManager) -> None:
+        """初始化删除请求合并器
+        
+        Args:
+            file_manager: 文件管理器对象
+        """
+        self.file_manager: FileManager = file_manager
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    async def delete(self, category: str, filename: str) -> str:
+        """提交删除请求并等待结果
+        
+        Args:
+            category: 分类名
+            filename: 文件名
+            
+        Returns:
+            str: 删除的文件名
+            
+        Raises:
+            CategoryNotFoundError: 分类不存在
+            FileNotFoundError: 文件不存在
+            MultipleFilesFoundError: 找到多个匹配的文件
+            FileDeleteError: 删除文件失败
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(category, []).append((filename, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        return await future
+    
+    async def _drain(self) -> None:
+        """循环处理积压的删除请求，直到队列为空"""
+        while self._pending:
+            batch, self._pending = self._pending, {}
+            for category, requests in batch.items():
+                try:
+                    results = await self.file_manager.delete_litematic_files_bulk_async(
+                        category, [filename for filename, _ in requests]
+                    )
+                except Exception as e:
+                    # 每个等待方使用各自的异常对象
+                    results = [_clone_exception(e) for _ in requests]
+                
+                for (_, future), result in zip(requests, results):
+                    # 等待方已取消时跳过
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+
 class DeleteCommand:
     def __init__(self, category_manager: CategoryManager, file_manager: FileManager) -> None:
         self.category_manager: CategoryManager = category_manager
         self.file_manager: FileManager = file_manager
+        self._delete_coalescer: _DeleteCoalescer = _DeleteCoalescer(file_manager)
     
     async def execute(self, event: AstrMessageEvent, category: CategoryType = "", filename: str = "") -> MessageResponse:
         """
@@ -38,53 +131,43 @@ class DeleteCommand:
             yield event.plain_result("请指定要删除的分类名，例如：/投影删除 建筑")
             return
         
+        operation = "删除文件" if filename else "删除分类"
+        # 整个命令只在结束时记录一次操作日志
+        status: Dict[str, Any] = {"category": category, "filename": filename}
+        success = False
         try:
             # 验证分类是否存在
             if not await self.category_manager.category_exists_async(category):
-                # 使用异步方法检查分类
-                log_operation("检查分类", False, {"category": category})
-                categories = await self.category_manager.get_categories_async()
-                yield event.plain_result(f"分类 {category} 不存在，可用的分类：{', '.join(categories)}")
+                status["error"] = "分类不存在"
+                yield event.plain_result(f"分类 {category} 不存在，可用的分类：{self.category_manager.get_categories_joined()}")
                 return
             
             # 删除整个分类
             if not filename:
-                try:
-                    # 使用异步方法删除分类
-                    await self.file_manager.delete_category_async(category)
-                    # 删除分类记录
-                    await self.category_manager.delete_category_async(category)
-                    log_operation("删除分类", True, {"category": category})
-                    yield event.plain_result(f"已删除分类 {category} 及其下所有文件")
-                except CategoryDeleteError as e:
-                    log_error(e)
-                    yield event.plain_result(f"删除分类失败: {e.message}")
-                except Exception as e:
-                    log_error(e, extra_info={"category": category, "operation": "删除分类"})
-                    yield event.plain_result(f"删除分类时出现错误: {str(e)}")
+                # 一次性删除分类目录及分类记录
+                await self.file_manager.delete_category_bulk_async(category)
+                success = True
+                yield event.plain_result(f"已删除分类 {category} 及其下所有文件")
                 return
             
-            # 删除指定文件
-            try:
-                # 使用异步方法删除文件
-                deleted_filename = await self.file_manager.delete_litematic_file_async(category, filename)
-                # 成功删除
-                log_operation("删除文件", True, {"category": category, "filename": deleted_filename})
-                yield event.plain_result(f"已删除文件: {deleted_filename}")
-            except MultipleFilesFoundError as e:
-                log_error(e)
-                matches_text = "\n".join([f"- {file}" for file in e.details.get("matches", [])])
-                yield event.plain_result(f"找到多个匹配的文件，请指定完整文件名：\n{matches_text}")
-            except FileNotFoundError as e:
-                log_error(e)
-                yield event.plain_result(e.message)
-            except FileDeleteError as e:
-                log_error(e)
-                yield event.plain_result(f"删除文件失败: {e.message}")
-            except Exception as e:
-                log_error(e, extra_info={"category": category, "filename": filename, "operation": "删除文件"})
-                yield event.plain_result(f"删除文件时出现错误: {str(e)}")
-                
+            # 删除指定文件 - 并发的删除请求会按分类合并为批量删除
+            deleted_filename = await self._delete_coalescer.delete(category, filename)
+            status["filename"] = deleted_filename
+            success = True
+            yield event.plain_result(f"已删除文件: {deleted_filename}")
+            
+        except LitematicPluginError as e:
+            # 已知异常按类型查表生成提示，未登记的类型按通用错误处理
+            status["error"] = e.message
+            formatter = _ERROR_FORMATTERS.get(type(e))
+            if formatter is not None:
+                yield event.plain_result(formatter(e))
+            else:
+                yield event.plain_result(f"{operation}时出现错误: {e.message}")
         except Exception as e:
-            log_error(e, extra_info={"category": category, "filename": filename, "operation": "执行删除命令"})
-            yield event.plain_result(f"执行命令时出现错误: {str(e)}") 
\ No newline at end of file
+            # 未知异常需要在except块内记录以保留堆栈信息
+            status["error"] = str(e)
+            log_error(e, extra_info={**status, "operation": operation})
+            yield event.plain_result(f"{operation}时出现错误: {str(e)}")
+        finally:
+            log_operation(operation, success, status)
@@ -1,12 +1,22 @@
-from typing import Optional, Tuple
 import os
-from astrbot import logger
+import asyncio
 from astrbot.api.event import AstrMessageEvent, MessageChain
 from astrbot.api.message_components import File
 from ..services.file_manager import FileManager
 from ..utils.types import CategoryType, FilePath, MessageResponse
 from ..utils.exceptions import FileNotFoundError, LitematicPluginError, CategoryNotFoundError
 from ..utils.logging_utils import log_error, log_operation
+from ..utils.task_utils import spawn_tracked
+
+# 固定提示文本
+_USAGE_TEXT = "请指定分类和文件名，例如：/投影获取 建筑 house.litematic"
+_SENDING_TEXT = "正在发送文件，请稍候..."
+
+# 文件发送超过该时长（秒）仍未完成时才发送等待提示
+_SENDING_HINT_DELAY: float = 0.25
+
+# 平台是否支持posix_fadvise（Windows不支持），导入时确定一次
+_HAS_FADVISE: bool = hasattr(os, "posix_fadvise")
 
 class GetCommand:
     def __init__(self, file_manager: FileManager) -> None:
@@ -28,15 +38,15 @@ class GetCommand:
         """
         # 验证参数
         if not category or not filename:
-            yield event.plain_result("请指定分类和文件名，例如：/投影获取 建筑 house.litematic")
+            yield event.plain_result(_USAGE_TEXT)
             return
         
         try:
             # 获取文件 - 使用异步方法
             file_path: FilePath = await self.file_manager.get_litematic_file_async(category, filename)
             
-            # 发送提示信息
-            yield event.plain_result("正在发送文件，请稍候...")
+            # 在线程池中预读文件到页缓存，框架随后读取文件时不会阻塞事件循环等待磁盘
+            await asyncio.to_thread(self._prefetch_file, file_path)
             
             # 构建消息链并发送文件
             file_name: str = os.path.basename(file_path)
@@ -45,7 +55,12 @@ class GetCommand:
             message: MessageChain = MessageChain()
             message.chain.append(file_component)
             
-            await event.send(message)
+            # 发送较快时不再额外发送提示信息，超过阈值仍未完成才提示用户等待
+            send_task: asyncio.Task = spawn_tracked(event.send(message))
+            done, _ = await asyncio.wait({send_task}, timeout=_SENDING_HINT_DELAY)
+            if not done:
+                yield event.plain_result(_SENDING_TEXT)
+            await send_task
             log_operation("发送文件", True, {"category": category, "filename": file_name, "path": file_path})
         except FileNotFoundError as e:
             log_error(e)
@@ -58,4 +73,27 @@ class GetCommand:
             yield event.plain_result(f"获取文件失败: {e.message}")
         except Exception as e:
             log_error(e, extra_info={"category": category, "filename": filename, "operation": "发送文件"})
-            yield event.plain_result(f"发送文件时出现错误: {str(e)}") 
\ No newline at end of file
+            yield event.plain_result(f"发送文件时出现错误: {str(e)}")
+    
+    @staticmethod
+    def _prefetch_file(file_path: FilePath) -> None:
+        """将文件内容预读到系统页缓存（在线程池中运行的IO操作）
+        
+        消息组件只接收文件路径，由平台适配器自行读取上传，因此这里不把文件读入内存，
+        只提示内核预读；不支持posix_fadvise的平台（如Windows）直接跳过。
+        
+        Args:
+            file_path: 文件路径
+        """
+        if not _HAS_FADVISE:
+            return
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
@@ -1,9 +1,9 @@
 import os
-import traceback
 import asyncio
-from typing import List, Optional, Tuple
+import functools
+from typing import Tuple
 from astrbot import logger
-from astrbot.api.event import AstrMessageEvent, MessageChain
+from astrbot.api.event import AstrMessageEvent
 from ..core.detail_analysis.detail_analysis import DetailAnalysis
 from litemapy import Schematic
 from ..services.file_manager import FileManager
@@ -15,6 +15,30 @@ from ..utils.exceptions import (
     LitematicPluginError
 )
 
+# 固定提示文本
+_USAGE_TEXT = "请指定分类和文件名，例如：/投影信息 建筑 house.litematic"
+_ANALYZING_TEXT = "正在分析投影文件，请稍候..."
+
+
+@functools.lru_cache(maxsize=32)
+def _analyze_schematic_cached(file_path: FilePath, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """按(路径, 修改时间, 大小)缓存投影分析结果，文件被替换后键随之变化而自动失效
+    
+    只缓存体积很小的分析文本，不缓存解析后的Schematic，避免长期占用大量内存。
+    
+    Args:
+        file_path: 投影文件路径
+        mtime_ns: 文件修改时间（纳秒）
+        size: 文件大小（字节）
+        
+    Returns:
+        Tuple[str, ...]: 分析结果
+    """
+    schematic: Schematic = Schematic.load(file_path)
+    analyzer: DetailAnalysis = DetailAnalysis(schematic)
+    return tuple(analyzer.analyze_schematic(file_path))
+
+
 class InfoCommand:
     """投影信息命令处理器，负责处理查看投影详细信息的命令"""
     
@@ -41,18 +65,23 @@ class InfoCommand:
         """
         # 验证参数
         if not category or not filename:
-            yield event.plain_result("请指定分类和文件名，例如：/投影信息 建筑 house.litematic")
+            yield event.plain_result(_USAGE_TEXT)
             return
-        
+
+        # 验证分类是否存在 - 命中缓存时无需访问文件系统
+        if not await self.category_manager.category_exists_async(category):
+            yield event.plain_result(f"分类 {category} 不存在，可用的分类：{self.category_manager.get_categories_joined()}")
+            return
+
         try:
             # 加载litematic文件
-            yield event.plain_result("正在分析投影文件，请稍候...")
+            yield event.plain_result(_ANALYZING_TEXT)
             
             # 获取文件路径 - 使用异步方法
             file_path: FilePath = await self.file_manager.get_litematic_file_async(category, filename)
             
             # 分析投影文件 - 使用线程池处理CPU密集型操作
-            schematic, details = await asyncio.to_thread(self._analyze_schematic, file_path)
+            details = await asyncio.to_thread(self._analyze_schematic, file_path)
             
             # 生成结果文本
             result_text: str = f"【{os.path.basename(file_path)}】详细信息：\n\n"
@@ -69,20 +98,19 @@ class InfoCommand:
             logger.error(f"分析投影文件失败: {e.message} (错误代码: {e.code})")
             yield event.plain_result(f"分析投影文件失败: {e.message}")
         except Exception as e:
-            logger.error(f"分析投影文件时出现未知错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception(f"分析投影文件时出现未知错误: {e}")
             yield event.plain_result(f"分析投影文件时出现错误: {str(e)}")
     
-    def _analyze_schematic(self, file_path: FilePath) -> Tuple[Schematic, List[str]]:
+    def _analyze_schematic(self, file_path: FilePath) -> Tuple[str, ...]:
         """分析投影文件（在线程池中运行的CPU密集型操作）
         
+        相同文件未修改时直接返回缓存的分析结果，跳过NBT解析。
+        
         Args:
             file_path: 投影文件路径
             
         Returns:
-            Tuple[Schematic, List[str]]: 结构体和分析结果
+            Tuple[str, ...]: 分析结果
         """
-        schematic: Schematic = Schematic.load(file_path)
-        analyzer: DetailAnalysis = DetailAnalysis(schematic)
-        details: List[str] = analyzer.analyze_schematic(file_path)
-        return schematic, details 
\ No newline at end of file
+        st = os.stat(file_path)
+        return _analyze_schematic_cached(file_path, st.st_mtime_ns, st.st_size) 
\ No newline at end of file
@@ -1,12 +1,15 @@
 from typing import List
-from astrbot import logger
-from astrbot.api.event import AstrMessageEvent, MessageChain
+from astrbot.api.event import AstrMessageEvent
 from ..services.category_manager import CategoryManager
 from ..services.file_manager import FileManager
 from ..utils.types import CategoryType, MessageResponse
-from ..utils.exceptions import CategoryNotFoundError, FileError
+from ..utils.exceptions import FileError
 from ..utils.logging_utils import log_error, log_operation
 
+# 固定提示文本
+_NO_CATEGORIES_TEXT = "还没有任何分类，使用 /投影 分类名 来创建分类"
+_LIST_FILES_HINT = "\n\n使用 /投影列表 分类名 查看分类下的文件"
+
 class ListCommand:
     def __init__(self, category_manager: CategoryManager, file_manager: FileManager) -> None:
         self.category_manager: CategoryManager = category_manager
@@ -32,19 +35,19 @@ class ListCommand:
                 categories: List[CategoryType] = await self.category_manager.get_categories_async()
                 if not categories:
                     log_operation("列出分类", True, {"result": "empty"})
-                    yield event.plain_result("还没有任何分类，使用 /投影 分类名 来创建分类")
+                    yield event.plain_result(_NO_CATEGORIES_TEXT)
                     return
                     
-                categories_text: str = "\n".join([f"- {cat}" for cat in categories])
+                # 直接使用分类管理器缓存的列表文本
+                categories_text: str = self.category_manager.get_categories_bulleted()
                 log_operation("列出分类", True, {"categories": categories})
-                yield event.plain_result(f"可用的分类列表：\n{categories_text}\n\n使用 /投影列表 分类名 查看分类下的文件")
+                yield event.plain_result(f"可用的分类列表：\n{categories_text}{_LIST_FILES_HINT}")
                 return
             
             # 验证分类是否存在 - 使用异步方法检查
             if not await self.category_manager.category_exists_async(category):
                 log_operation("检查分类", False, {"category": category})
-                categories = await self.category_manager.get_categories_async()
-                yield event.plain_result(f"分类 {category} 不存在，可用的分类：{', '.join(categories)}")
+                yield event.plain_result(f"分类 {category} 不存在，可用的分类：{self.category_manager.get_categories_joined()}")
                 return
             
             # 列出分类下的文件
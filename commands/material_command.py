@@ -1,14 +1,17 @@
 import os
-import traceback
 import asyncio
+import multiprocessing
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Optional, Tuple, List
 from astrbot import logger
-from astrbot.api.event import AstrMessageEvent, MessageChain
-from litemapy import Schematic
+from astrbot.api.event import AstrMessageEvent
 from ..services.file_manager import FileManager
 from ..services.category_manager import CategoryManager
 from ..services.lang_manager import LangManager
-from ..core.material.material import Material
+from ..core.material.material import analyze_material_file
 from ..utils.types import CategoryType, FilePath, BlockCounts, EntityCounts, MessageResponse, BlockId
 from ..utils.exceptions import (
     CategoryNotFoundError, 
@@ -18,6 +21,61 @@ from ..utils.exceptions import (
 )
 from ..utils.logging_utils import log_error, log_operation
 
+# 材料分析结果：方块统计、实体统计、方块实体统计
+MaterialCounts = Tuple[BlockCounts, EntityCounts, Dict[str, int]]
+
+# 材料分析进程池，首次使用时创建，插件卸载时关闭
+_process_pool: Optional[ProcessPoolExecutor] = None
+# 进程池损坏（如子进程无法启动）后不再重建，插件重新加载前一直使用线程池执行
+_process_pool_broken: bool = False
+
+# 材料分析结果缓存，键为(路径, 修改时间, 大小)，只保存统计结果，按LRU淘汰
+_MATERIAL_CACHE_SIZE: int = 64
+_material_cache: "OrderedDict[Tuple[FilePath, int, int], MaterialCounts]" = OrderedDict()
+
+
+def invalidate_material_cache(file_path: Optional[FilePath] = None) -> None:
+    """使材料分析缓存失效
+    
+    Args:
+        file_path: 文件路径，为None时清空全部缓存
+    """
+    if file_path is None:
+        _material_cache.clear()
+        return
+    for key in [key for key in _material_cache if key[0] == file_path]:
+        del _material_cache[key]
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """获取（必要时创建）材料分析进程池
+    
+    子进程使用spawn方式启动：AstrBot进程中已有事件循环和多个线程池，
+    fork会把持有中的锁一并复制到子进程，可能导致子进程死锁
+    
+    Args:
+        max_workers: 最大工作进程数，不超过CPU核心数
+        
+    Returns:
+        ProcessPoolExecutor: 进程池
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max(1, min(max_workers, os.cpu_count() or 1)),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_pool
+
+
+def _shutdown_process_pool() -> None:
+    """关闭材料分析进程池"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
 class MaterialCommand:
     # 数量单位常量
     STACK_SIZE: int = 64  # 一组
@@ -81,59 +139,51 @@ class MaterialCommand:
             # 获取文件路径 - 使用异步方法
             file_path: FilePath = await self.file_manager.get_litematic_file_async(category, filename)
             
-            # 使用Material类分析文件 - 由于这是CPU密集型操作，使用线程池运行
-            schematic, block_counts, entity_counts, tile_counts = await asyncio.to_thread(
-                self._analyze_material, file_path
-            )
-            
-            # 使用Material类分析文件
-            material_analyzer: Material = Material("材料分析", 0)
+            # 使用Material类分析文件 - 由于这是CPU密集型操作，在进程池中运行
+            block_counts, entity_counts, tile_counts = await self._analyze_material(file_path)
             
-            # 获取方块和实体统计
-            block_counts: BlockCounts = material_analyzer.block_collection(schematic)
-            entity_counts: EntityCounts = material_analyzer.entity_collection(schematic)
-            tile_counts: Dict[str, int] = material_analyzer.tile_collection(schematic)
+            # 分段发送结果：方块清单先行发出，实体与方块实体各自单独一段，
+            # 每段先收集各行再一次性拼接
+            parts: List[str] = [f"【{os.path.basename(file_path)}】材料清单：\n\n"]
             
-            # 格式化结果
-            result: str = f"【{os.path.basename(file_path)}】材料清单：\n\n"
-            
-            # 添加方块信息
+            # 方块信息
             if block_counts:
-                result += "方块材料：\n"
-                sorted_blocks: List[Tuple[BlockId, int]] = sorted(block_counts.items(), key=lambda item: item[1], reverse=True)
-                for block_id, count in sorted_blocks:
-                    # 使用翻译功能翻译方块ID
-                    translated_name = self.lang_manager.translate_block(block_id)
-                    result += f"- {translated_name}: {self._format_count(count)}\n"
+                parts.append("方块材料：\n")
+                sorted_blocks: List[Tuple[BlockId, int]] = sorted(block_counts.items(), key=itemgetter(1), reverse=True)
+                # 使用翻译功能翻译方块ID
+                parts.extend([
+                    f"- {self.lang_manager.translate_block(block_id)}: {self._format_count(count)}\n"
+                    for block_id, count in sorted_blocks
+                ])
             else:
-                result += "无方块材料\n"
+                parts.append("无方块材料\n")
+            yield event.plain_result("".join(parts))
             
-            # 添加实体信息
+            # 实体信息
             if entity_counts:
-                result += "\n实体：\n"
-                sorted_entities: List[Tuple[str, int]] = sorted(entity_counts.items(), key=lambda item: item[1], reverse=True)
-                for entity_id, count in sorted_entities:
-                    # 使用翻译功能翻译实体ID
-                    translated_name = self.lang_manager.translate_entity(entity_id)
-                    result += f"- {translated_name}: {self._format_count(count)}\n"
+                parts = ["实体：\n"]
+                sorted_entities: List[Tuple[str, int]] = sorted(entity_counts.items(), key=itemgetter(1), reverse=True)
+                # 使用翻译功能翻译实体ID
+                parts.extend([
+                    f"- {self.lang_manager.translate_entity(entity_id)}: {self._format_count(count)}\n"
+                    for entity_id, count in sorted_entities
+                ])
+                yield event.plain_result("".join(parts))
             
-            # 添加方块实体信息
+            # 方块实体信息
             if tile_counts:
-                result += "\n方块实体：\n"
-                sorted_tiles: List[Tuple[str, int]] = sorted(tile_counts.items(), key=lambda item: item[1], reverse=True)
+                parts = ["方块实体：\n"]
+                sorted_tiles: List[Tuple[str, int]] = sorted(tile_counts.items(), key=itemgetter(1), reverse=True)
                 for tile_id, count in sorted_tiles:
                     # 确保正确显示，处理不同类型的tile_id
                     if isinstance(tile_id, tuple) and len(tile_id) > 0:
-                        # 使用翻译功能翻译方块实体ID
-                        translated_name = self.lang_manager.translate_block(tile_id[0])
-                        result += f"- {translated_name}: {self._format_count(count)}\n"
-                    else:
-                        # 使用翻译功能翻译方块实体ID
-                        translated_name = self.lang_manager.translate_block(tile_id)
-                        result += f"- {translated_name}: {self._format_count(count)}\n"
+                        tile_id = tile_id[0]
+                    # 使用翻译功能翻译方块实体ID
+                    translated_name = self.lang_manager.translate_block(tile_id)
+                    parts.append(f"- {translated_name}: {self._format_count(count)}\n")
+                yield event.plain_result("".join(parts))
             
             log_operation("分析材料", True, {"category": category, "filename": filename})
-            yield event.plain_result(result)
             
         except FileNotFoundError as e:
             log_error(e)
@@ -148,26 +198,58 @@ class MaterialCommand:
             log_error(e, extra_info={"category": category, "filename": filename})
             yield event.plain_result(f"分析材料失败: {e.message}")
         except Exception as e:
-            error_details = {"category": category, "filename": filename, "error": str(e), "traceback": traceback.format_exc()}
-            log_error(e, extra_info=error_details)
+            # 堆栈由log_error通过exc_info记录，这里不再预先格式化
+            log_error(e, extra_info={"category": category, "filename": filename, "error": str(e)})
             yield event.plain_result(f"分析材料时出现错误: {str(e)}")
 
-    def _analyze_material(self, file_path: FilePath) -> Tuple[Schematic, BlockCounts, EntityCounts, Dict[str, int]]:
+    async def _analyze_material(self, file_path: FilePath) -> MaterialCounts:
         """
-        分析Litematic文件中的材料（CPU密集型操作，在线程池中运行）
+        分析Litematic文件中的材料
+        
+        相同文件未修改时直接返回缓存结果；否则解析与统计在进程池中运行，
+        多个材料分析请求可以真正并行，进程池不可用时退回到线程池执行。
         
         Args:
             file_path: Litematic文件路径
             
         Returns:
-            Tuple[Schematic, BlockCounts, EntityCounts, Dict[str, int]]: 结构体及统计数据
+            MaterialCounts: 方块、实体、方块实体统计
+            
+        Raises:
+            InvalidArgumentError: 文件超过大小上限时
         """
-        schematic: Schematic = Schematic.load(file_path)
-        material_analyzer: Material = Material("材料分析", 0)
+        # 只stat一次：修改时间和大小同时用于缓存键和大小检查
+        st = await asyncio.to_thread(os.stat, file_path)
+        max_size: int = self.file_manager.config.get_config_value("max_schematic_size_bytes", 64 * 1024 * 1024)
+        if st.st_size > max_size:
+            raise InvalidArgumentError("文件", f"文件过大（{st.st_size} 字节），超过 {max_size} 字节的上限")
         
-        # 获取方块和实体统计
-        block_counts: BlockCounts = material_analyzer.block_collection(schematic)
-        entity_counts: EntityCounts = material_analyzer.entity_collection(schematic)
-        tile_counts: Dict[str, int] = material_analyzer.tile_collection(schematic)
+        # 文件未修改时直接返回缓存的统计结果，跳过解析
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        cached = _material_cache.get(key)
+        if cached is not None:
+            _material_cache.move_to_end(key)
+            return cached
         
-        return schematic, block_counts, entity_counts, tile_counts 
\ No newline at end of file
+        global _process_pool_broken
+        if _process_pool_broken:
+            counts = await asyncio.to_thread(analyze_material_file, file_path)
+        else:
+            loop = asyncio.get_running_loop()
+            max_workers: int = self.file_manager.config.get_config_value("max_workers", 3)
+            try:
+                counts = await loop.run_in_executor(_get_process_pool(max_workers), analyze_material_file, file_path)
+            except BrokenProcessPool as e:
+                logger.warning(f"材料分析进程池不可用，之后改用线程池执行: {e}")
+                _process_pool_broken = True
+                _shutdown_process_pool()
+                counts = await asyncio.to_thread(analyze_material_file, file_path)
+        
+        _material_cache[key] = counts
+        if len(_material_cache) > _MATERIAL_CACHE_SIZE:
+            _material_cache.popitem(last=False)
+        return counts
+    
+    def shutdown(self) -> None:
+        """释放材料分析占用的进程池，插件卸载时调用"""
+        _shutdown_process_pool()
@@ -1,21 +1,112 @@
 import os
-import traceback
 import asyncio
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from astrbot import logger
 from astrbot.api.event import AstrMessageEvent, MessageChain
-from astrbot.api.message_components import Image
+from astrbot.api.message_components import Image, Plain
 from ..services.file_manager import FileManager
 from ..services.render_manager import RenderManager, LAYOUT_MAPPING
 from ..utils.types import CategoryType, FilePath, MessageResponse
+from ..utils.task_utils import spawn_tracked
 from ..utils.exceptions import (
     CategoryNotFoundError, 
     FileNotFoundError, 
     LitematicPluginError,
-    RenderError,
     InvalidViewTypeError
 )
 
+# 加载提示文本
+_RENDERING_TEXT = "正在生成预览图，请稍候..."
+
+# 渲染超过该时长（秒）仍未完成时才发送加载提示
+_RENDERING_HINT_DELAY: float = 0.25
+
+# 视图类型说明文字
+_VIEW_CAPTIONS: Dict[str, str] = {
+    "top": "俯视图 (从上向下看)",
+    "front": "正视图 (北面)",
+    "north": "正视图 (北面)",
+    "side": "侧视图 (东面)",
+    "east": "侧视图 (东面)",
+    "south": "南面视图",
+    "west": "西面视图",
+    "combined": "综合视图 (俯视图 + 正视图 + 侧视图)"
+}
+_DEFAULT_VIEW_CAPTION = "综合视图"
+
+# 布局类型说明文字
+_LAYOUT_CAPTIONS: Dict[str, str] = {
+    "vertical": "垂直布局",
+    "v": "垂直布局",
+    "horizontal": "水平布局",
+    "h": "水平布局",
+    "grid": "网格布局",
+    "g": "网格布局",
+    "stacked": "堆叠布局",
+    "s": "堆叠布局",
+    "combined": "综合布局",
+    "c": "综合布局"
+}
+
+# 帮助文本
+_HELP_TEXT = (
+    "投影预览命令使用方法：\n"
+    "/投影预览 分类 文件名 [视角][:布局][:参数]\n\n"
+    "支持的视角：\n"
+    "- top: 俯视图\n"
+    "- front/north: 正视图(北面)\n"
+    "- side/east: 侧视图(东面)\n"
+    "- south: 南面视图\n"
+    "- west: 西面视图\n"
+    "- combined: 综合视图(默认)\n\n"
+    "支持的布局：\n"
+    "- vertical/v: 垂直布局\n"
+    "- horizontal/h: 水平布局\n"
+    "- grid/g: 网格布局\n"
+    "- stacked/s: 堆叠布局\n"
+    "- combined/c: 综合布局(默认)\n\n"
+    "可选参数：\n"
+    "- spacing=数字: 设置间距\n"
+    "- labels: 添加标签\n"
+    "- nomodel: 禁用方块模型渲染\n\n"
+    "例如：/投影预览 建筑 房子 combined:v:spacing=10:labels:nomodel"
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_view_spec(spec: str) -> Tuple[str, Optional[str], Optional[int], bool, bool]:
+    """
+    解析 视角[:布局][:参数] 形式的视图参数，结果按参数字符串缓存
+    
+    Args:
+        spec: 视图参数字符串，如 "combined:v:spacing=10:labels"
+        
+    Returns:
+        Tuple[str, Optional[str], Optional[int], bool, bool]:
+            视图类型、布局（未指定为None）、间距（未指定为None）、是否添加标签、是否禁用方块模型
+    """
+    view_type, _, rest = spec.partition(":")
+    layout: Optional[str] = None
+    spacing: Optional[int] = None
+    add_labels = False
+    no_model = False
+    for part in rest.split(":"):
+        if part in LAYOUT_MAPPING:
+            layout = part
+        elif part == "labels":
+            add_labels = True
+        elif part == "nomodel":
+            no_model = True
+        else:
+            key, sep, value = part.partition("=")
+            if sep and key == "spacing":
+                try:
+                    spacing = int(value)
+                except ValueError:
+                    pass
+    return view_type, layout, spacing, add_labels, no_model
+
 class PreviewCommand:
     def __init__(self, file_manager: FileManager, render_manager: RenderManager) -> None:
         self.file_manager: FileManager = file_manager
@@ -41,22 +132,16 @@ class PreviewCommand:
             MessageChain: 响应消息
         """
         # 解析布局相关参数
-        parts = view_type.split(":")
-        if len(parts) > 1:
-            view_type = parts[0]
-            # 解析附加参数
-            for part in parts[1:]:
-                if part in LAYOUT_MAPPING:
-                    layout = part
-                elif part.startswith("spacing="):
-                    try:
-                        spacing = int(part.split("=")[1])
-                    except ValueError:
-                        pass
-                elif part == "labels":
-                    add_labels = True
-                elif part == "nomodel":
-                    use_block_models = False
+        if ":" in view_type:
+            view_type, spec_layout, spec_spacing, spec_labels, spec_nomodel = _parse_view_spec(view_type)
+            if spec_layout is not None:
+                layout = spec_layout
+            if spec_spacing is not None:
+                spacing = spec_spacing
+            if spec_labels:
+                add_labels = True
+            if spec_nomodel:
+                use_block_models = False
         
         # 验证参数
         if not category or not filename:
@@ -64,14 +149,12 @@ class PreviewCommand:
             return
         
         try:
-            # 发送加载提示
-            yield event.plain_result("正在生成预览图，请稍候...")
-            
             # 获取文件路径 - 使用异步方法
             file_path: FilePath = await self.file_manager.get_litematic_file_async(category, filename)
+            file_name: str = os.path.basename(file_path)
             
-            # 渲染litematic文件 - 使用异步方法
-            image_path: FilePath = await self.render_manager.render_litematic_async(
+            # 渲染litematic文件 - 相同文件和参数直接复用缓存的预览图
+            render_task: asyncio.Task = spawn_tracked(self.render_manager.render_litematic_cached_async(
                 file_path, 
                 view_type, 
                 scale=1, 
@@ -79,44 +162,32 @@ class PreviewCommand:
                 spacing=spacing,
                 add_labels=add_labels,
                 use_block_models=use_block_models
-            )
+            ))
             
-            # 准备消息链
-            message: MessageChain = MessageChain()
-            message.chain.append(Image.fromFileSystem(image_path))
-            
-            # 发送图像
-            await event.send(message)
+            # 命中缓存时很快完成，只有渲染超过阈值仍未完成才发送加载提示
+            done, _ = await asyncio.wait({render_task}, timeout=_RENDERING_HINT_DELAY)
+            if not done:
+                yield event.plain_result(_RENDERING_TEXT)
+            image_path: FilePath = await render_task
             
             # 获取视图说明
-            caption = self._get_view_caption(view_type)
             layout_caption = self._get_layout_caption(layout) if layout else ""
-            caption_text = f"【{os.path.basename(file_path)}】{caption}"
-            if layout_caption:
-                caption_text += f" - {layout_caption}"
+            caption_text = (f"【{file_name}】{self._get_view_caption(view_type)}"
+                            f"{' - ' + layout_caption if layout_caption else ''}")
             
-            # 发送说明文本
-            yield event.plain_result(caption_text)
-            
-            # 删除临时图像文件 - 使用异步删除
-            if os.path.exists(image_path):
-                await asyncio.to_thread(os.remove, image_path)
+            # 图像和说明文本放在同一条消息中发送
+            message: MessageChain = MessageChain()
+            message.chain.append(Image.fromFileSystem(image_path))
+            message.chain.append(Plain(caption_text))
+            await event.send(message)
                 
-        except FileNotFoundError as e:
-            yield event.plain_result(e.message)
-        except CategoryNotFoundError as e:
-            yield event.plain_result(e.message)
-        except InvalidViewTypeError as e:
+        except (FileNotFoundError, CategoryNotFoundError, InvalidViewTypeError) as e:
             yield event.plain_result(e.message)
-        except RenderError as e:
-            logger.error(f"渲染失败: {e.message} (错误代码: {e.code})")
-            yield event.plain_result(f"生成预览图失败: {e.message}")
         except LitematicPluginError as e:
             logger.error(f"渲染失败: {e.message} (错误代码: {e.code})")
             yield event.plain_result(f"生成预览图失败: {e.message}")
         except Exception as e:
-            logger.error(f"生成预览图时出现未知错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception(f"生成预览图时出现未知错误: {e}")
             yield event.plain_result(f"生成预览图时出现错误: {str(e)}")
     
     def _get_view_caption(self, view_type: str) -> str:
@@ -129,18 +200,7 @@ class PreviewCommand:
         Returns:
             str: 说明文字
         """
-        view_type = view_type.lower()
-        captions: Dict[str, str] = {
-            "top": "俯视图 (从上向下看)",
-            "front": "正视图 (北面)",
-            "north": "正视图 (北面)",
-            "side": "侧视图 (东面)",
-            "east": "侧视图 (东面)",
-            "south": "南面视图",
-            "west": "西面视图",
-            "combined": "综合视图 (俯视图 + 正视图 + 侧视图)"
-        }
-        return captions.get(view_type, "综合视图")
+        return _VIEW_CAPTIONS.get(view_type.lower(), _DEFAULT_VIEW_CAPTION)
     
     def _get_layout_caption(self, layout: str) -> str:
         """
@@ -152,20 +212,7 @@ class PreviewCommand:
         Returns:
             str: 说明文字
         """
-        layout = layout.lower()
-        captions: Dict[str, str] = {
-            "vertical": "垂直布局",
-            "v": "垂直布局",
-            "horizontal": "水平布局",
-            "h": "水平布局",
-            "grid": "网格布局",
-            "g": "网格布局",
-            "stacked": "堆叠布局",
-            "s": "堆叠布局",
-            "combined": "综合布局",
-            "c": "综合布局"
-        }
-        return captions.get(layout, "")
+        return _LAYOUT_CAPTIONS.get(layout.lower(), "")
     
     def _get_help_text(self) -> str:
         """
@@ -174,25 +221,4 @@ class PreviewCommand:
         Returns:
             str: 帮助文本
         """
-        return (
-            "投影预览命令使用方法：\n"
-            "/投影预览 分类 文件名 [视角][:布局][:参数]\n\n"
-            "支持的视角：\n"
-            "- top: 俯视图\n"
-            "- front/north: 正视图(北面)\n"
-            "- side/east: 侧视图(东面)\n"
-            "- south: 南面视图\n"
-            "- west: 西面视图\n"
-            "- combined: 综合视图(默认)\n\n"
-            "支持的布局：\n"
-            "- vertical/v: 垂直布局\n"
-            "- horizontal/h: 水平布局\n"
-            "- grid/g: 网格布局\n"
-            "- stacked/s: 堆叠布局\n"
-            "- combined/c: 综合布局(默认)\n\n"
-            "可选参数：\n"
-            "- spacing=数字: 设置间距\n"
-            "- labels: 添加标签\n"
-            "- nomodel: 禁用方块模型渲染\n\n"
-            "例如：/投影预览 建筑 房子 combined:v:spacing=10:labels:nomodel"
-        ) 
\ No newline at end of file
+        return _HELP_TEXT
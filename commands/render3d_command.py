@@ -1,20 +1,62 @@
 import os
 import re
-import traceback
+import errno
 import asyncio
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, FrozenSet, Optional, Tuple
 from astrbot import logger
 from astrbot.api.event import AstrMessageEvent, MessageChain
-from astrbot.api.message_components import Image
+from astrbot.api.message_components import Image, Plain
 
 from ..services.file_manager import FileManager
 from ..services.render_3d_manager import Render3DManager
 from ..utils.types import CategoryType, FilePath, MessageResponse
+from ..utils.task_utils import spawn_tracked
 from ..utils.exceptions import (
     CategoryNotFoundError, 
     FileNotFoundError, 
-    LitematicPluginError,
-    RenderError
+    LitematicPluginError
+)
+
+# 分辨率参数的正则，导入时编译一次
+_NATIVE_RE = re.compile(r"^(native|原生|原生分辨率|auto|自动)(?:[@:](\d+)(?:\s*[xX×\*_,]\s*(\d+))?)?$")
+_WXH_RE = re.compile(r"^(\d+)\s*[xX×\*_,]\s*(\d+)$")
+# 不带参数的分辨率写法，空字符串视为native
+_NATIVE_LITERALS: FrozenSet[str] = frozenset(("", "native", "原生", "原生分辨率", "auto", "自动"))
+_DEFAULT_LITERALS: FrozenSet[str] = frozenset(("default", "默认"))
+
+# 动画类型说明文字
+_ANIMATION_CAPTIONS: Dict[str, str] = {
+    "rotation": "旋转动画",
+    "orbit": "环绕动画",
+    "zoom": "缩放动画"
+}
+
+# 支持的动画类型
+_VALID_ANIMATIONS: FrozenSet[str] = frozenset(_ANIMATION_CAPTIONS)
+
+# 帧数、每帧持续时间、仰角的取值范围及超出范围时的提示
+_RANGE_CHECKS: Tuple[Tuple[float, float, str], ...] = (
+    (1, 120, "帧数必须在1到120之间"),
+    (50, 500, "每帧持续时间必须在50到500毫秒之间"),
+    (0, 90, "相机仰角必须在0到90度之间"),
+)
+
+# 帮助文本
+_HELP_TEXT = (
+    "3D渲染命令使用方法：\n"
+    "/投影3D 分类 文件名 [动画类型] [帧数] [持续时间] [仰角] [分辨率]\n\n"
+    "支持的动画类型：\n"
+    "- rotation: 旋转动画(默认)\n"
+    "- orbit: 环绕动画\n"
+    "- zoom: 缩放动画\n\n"
+    "可选参数：\n"
+    "- 帧数: 1-120之间的整数，默认36\n"
+    "- 持续时间: 每帧的持续时间(毫秒)，50-500之间，默认100\n"
+    "- 仰角: 相机仰角(度)，0-90之间，默认30\n"
+    "- 分辨率: native(按贴图原生分辨率自动计算，可用 native@12000 提高上限)\n"
+    "          default(固定800x600) / WxH，例如 1024x768\n\n"
+    "例如：/投影3D 建筑 房子 rotation 36 100 30 native\n"
+    "或：/投影3D 建筑 房子 rotation 36 100 30 1024x768"
 )
 
 class Render3DCommand:
@@ -56,24 +98,15 @@ class Render3DCommand:
             return
         
         # 验证动画类型
-        if animation_type not in ["rotation", "orbit", "zoom"]:
+        if animation_type not in _VALID_ANIMATIONS:
             yield event.plain_result(f"不支持的动画类型: {animation_type}，请使用 rotation、orbit 或 zoom")
             return
         
-        # 验证帧数
-        if frames < 1 or frames > 120:
-            yield event.plain_result("帧数必须在1到120之间")
-            return
-        
-        # 验证持续时间
-        if duration < 50 or duration > 500:
-            yield event.plain_result("每帧持续时间必须在50到500毫秒之间")
-            return
-        
-        # 验证仰角
-        if elevation < 0 or elevation > 90:
-            yield event.plain_result("相机仰角必须在0到90度之间")
-            return
+        # 验证帧数、持续时间和仰角的取值范围
+        for value, (low, high, message) in zip((frames, duration, elevation), _RANGE_CHECKS):
+            if not low <= value <= high:
+                yield event.plain_result(message)
+                return
 
         # 验证分辨率
         try:
@@ -82,12 +115,14 @@ class Render3DCommand:
             yield event.plain_result(str(e))
             return
         
+        gif_path: Optional[str] = None
         try:
             # 发送处理提示
             yield event.plain_result("正在生成3D渲染动画，请稍候...")
             
             # 获取文件路径
             file_path: FilePath = await self.file_manager.get_litematic_file_async(category, filename)
+            file_name: str = os.path.basename(file_path)
             
             # 渲染3D动画
             gif_path = await self.render_3d_manager.render_litematic_3d_async(
@@ -102,36 +137,41 @@ class Render3DCommand:
                 native_max_size=native_max_size
             )
             
-            # 准备消息链
+            # GIF和说明文本放在同一条消息中发送
+            caption = self._get_animation_caption(animation_type)
             message: MessageChain = MessageChain()
             message.chain.append(Image.fromFileSystem(gif_path))
-            
-            # 发送GIF
+            message.chain.append(Plain(f"【{file_name}】3D{caption}"))
             await event.send(message)
-            
-            # 发送说明文本
-            caption = self._get_animation_caption(animation_type)
-            yield event.plain_result(f"【{os.path.basename(file_path)}】3D{caption}")
-            
-            # 删除临时文件
-            if os.path.exists(gif_path):
-                await asyncio.to_thread(os.remove, gif_path)
                 
-        except FileNotFoundError as e:
+        except (FileNotFoundError, CategoryNotFoundError) as e:
             yield event.plain_result(e.message)
-        except CategoryNotFoundError as e:
-            yield event.plain_result(e.message)
-        except RenderError as e:
-            logger.error(f"3D渲染失败: {e.message} (错误代码: {e.code})")
-            yield event.plain_result(f"3D渲染失败: {e.message}")
         except LitematicPluginError as e:
             logger.error(f"3D渲染失败: {e.message} (错误代码: {e.code})")
             yield event.plain_result(f"3D渲染失败: {e.message}")
         except Exception as e:
-            logger.error(f"3D渲染时出现未知错误: {e}")
-            logger.error(f"错误详情: {traceback.format_exc()}")
+            logger.exception(f"3D渲染时出现未知错误: {e}")
             yield event.plain_result(f"3D渲染时出现错误: {str(e)}")
+        finally:
+            # 删除临时文件 - 发送失败时也要清理；在后台线程中执行，不等待删除完成即结束命令
+            if gif_path:
+                spawn_tracked(asyncio.to_thread(self._remove_temp_file, gif_path))
     
+    @staticmethod
+    def _remove_temp_file(path: str) -> None:
+        """
+        删除临时文件，文件不存在时忽略，其他错误只记录警告
+
+        Args:
+            path: 临时文件路径
+        """
+        try:
+            os.remove(path)
+        except OSError as e:
+            # 不用先exists再remove，文件已不存在时直接忽略
+            if e.errno != errno.ENOENT:
+                logger.warning(f"删除临时文件失败: {e}")
+
     def _get_animation_caption(self, animation_type: str) -> str:
         """
         获取动画类型对应的说明文字
@@ -142,12 +182,7 @@ class Render3DCommand:
         Returns:
             str: 说明文字
         """
-        captions: Dict[str, str] = {
-            "rotation": "旋转动画",
-            "orbit": "环绕动画",
-            "zoom": "缩放动画"
-        }
-        return captions.get(animation_type, "动画")
+        return _ANIMATION_CAPTIONS.get(animation_type, "动画")
     
     def _get_help_text(self) -> str:
         """
@@ -156,22 +191,7 @@ class Render3DCommand:
         Returns:
             str: 帮助文本
         """
-        return (
-            "3D渲染命令使用方法：\n"
-            "/投影3D 分类 文件名 [动画类型] [帧数] [持续时间] [仰角] [分辨率]\n\n"
-            "支持的动画类型：\n"
-            "- rotation: 旋转动画(默认)\n"
-            "- orbit: 环绕动画\n"
-            "- zoom: 缩放动画\n\n"
-            "可选参数：\n"
-            "- 帧数: 1-120之间的整数，默认36\n"
-            "- 持续时间: 每帧的持续时间(毫秒)，50-500之间，默认100\n"
-            "- 仰角: 相机仰角(度)，0-90之间，默认30\n"
-            "- 分辨率: native(按贴图原生分辨率自动计算，可用 native@12000 提高上限)\n"
-            "          default(固定800x600) / WxH，例如 1024x768\n\n"
-            "例如：/投影3D 建筑 房子 rotation 36 100 30 native\n"
-            "或：/投影3D 建筑 房子 rotation 36 100 30 1024x768"
-        )
+        return _HELP_TEXT
 
     def _parse_resolution(self, resolution: str) -> Tuple[Optional[Tuple[int, int]], bool, Optional[Tuple[int, int]]]:
         min_size = 64
@@ -181,13 +201,13 @@ class Render3DCommand:
             return None, True, None
 
         value = str(resolution).strip().lower()
-        if not value:
+        # 常见的不带参数写法直接查表返回，只有 native@上限 和 WxH 才需要正则
+        if value in _NATIVE_LITERALS:
             return None, True, None
+        if value in _DEFAULT_LITERALS:
+            return None, False, None
 
-        native_match = re.match(
-            r"^(native|原生|原生分辨率|auto|自动)(?:[@:](\d+)(?:\s*[xX×\*_,]\s*(\d+))?)?$",
-            value
-        )
+        native_match = _NATIVE_RE.match(value)
         if native_match:
             if native_match.group(2):
                 max_width = int(native_match.group(2))
@@ -200,10 +220,7 @@ class Render3DCommand:
                 return None, True, (max_width, max_height)
             return None, True, None
 
-        if value in {"default", "默认"}:
-            return None, False, None
-
-        match = re.match(r"^(\d+)\s*[xX×\*_,]\s*(\d+)$", value)
+        match = _WXH_RE.match(value)
         if not match:
             raise ValueError("分辨率格式错误，请使用 native、default、native@上限 或 WxH，例如 1024x768/1024×768")
 
@@ -1,25 +1,50 @@
 import time
-import os
-import shutil
 import asyncio
-from typing import Dict, Any
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Optional
 
 from astrbot import logger
-from astrbot.api.event import AstrMessageEvent, MessageChain
+from astrbot.api.event import AstrMessageEvent
 from astrbot.api.message_components import File
 
+from .material_command import invalidate_material_cache
 from ..services.file_manager import FileManager
 from ..services.category_manager import CategoryManager
 from ..utils.types import UploadStatus, UserKey, MessageResponse, CategoryType
-from ..utils.exceptions import CategoryNotFoundError, CategoryCreateError, CategoryAlreadyExistsError, FileSaveError
+from ..utils.exceptions import CategoryCreateError, CategoryAlreadyExistsError, FileSaveError
 from ..utils.logging_utils import log_error, log_operation
 
+# litematic文件扩展名
+_LITEMATIC_SUFFIX = ".litematic"
+
+# 上传状态的有效时长（秒）；所有状态使用相同时长，插入顺序即过期顺序，不需要按过期时间建堆
+_UPLOAD_TIMEOUT_SEC: int = 300
+
+
+def _normalize_litematic_name(name: Optional[str]) -> Optional[str]:
+    """
+    检查文件名是否为litematic文件（扩展名不区分大小写），并统一为小写扩展名
+    
+    Args:
+        name: 原始文件名
+        
+    Returns:
+        Optional[str]: 规范化后的文件名，不是litematic文件时返回None
+    """
+    if not name or not name.lower().endswith(_LITEMATIC_SUFFIX):
+        return None
+    return name[:-len(_LITEMATIC_SUFFIX)] + _LITEMATIC_SUFFIX
+
 class UploadCommand:
-    def __init__(self, file_manager: FileManager, category_manager: CategoryManager) -> None:
+    def __init__(self, file_manager: FileManager, category_manager: CategoryManager,
+                 executor: Optional[Executor] = None) -> None:
         self.file_manager: FileManager = file_manager
         self.category_manager: CategoryManager = category_manager
-        self.upload_states: Dict[UserKey, UploadStatus] = {}  # 用户上传状态跟踪
-        self.timeout_tasks: Dict[UserKey, asyncio.Task] = {}  # 超时任务
+        # 保存上传文件使用的线程池，为None时使用默认线程池
+        self.executor: Optional[Executor] = executor
+        # 用户上传状态跟踪，按过期时间先后排列，过期条目在每次访问时从队首清理
+        self.upload_states: "OrderedDict[UserKey, UploadStatus]" = OrderedDict()
     
     async def execute(self, event: AstrMessageEvent, category: CategoryType = "default") -> MessageResponse:
         """
@@ -45,7 +70,7 @@ class UploadCommand:
         try:
             # 显示帮助信息
             if not category or category == "default":
-                categories_text = "\n".join([f"- {cat}" for cat in await self.category_manager.get_categories_async()])
+                categories_text = self.category_manager.get_categories_bulleted()
                 yield event.plain_result(
                     f"""投影
 上传litematic到指定分类文件夹下使用方法：
@@ -81,25 +106,18 @@ class UploadCommand:
                 
                 # 记录用户上传状态
                 user_key: UserKey = f"{event.session_id}_{event.get_sender_id()}"
-                timeout_sec = 300  # 5分钟超时
+                now = time.monotonic()
+                self._sweep_expired(now)
                 
-                # 清除之前的超时任务（如果存在）
-                if user_key in self.timeout_tasks and not self.timeout_tasks[user_key].done():
-                    self.timeout_tasks[user_key].cancel()
-                
-                # 设置新的状态和超时任务
+                # 重新插入到队尾，保持按过期时间排序
+                self.upload_states.pop(user_key, None)
                 self.upload_states[user_key] = {
                     "category": category,
-                    "expire_time": time.time() + timeout_sec
+                    "expire_time": now + _UPLOAD_TIMEOUT_SEC
                 }
                 
-                # 创建新的超时任务
-                self.timeout_tasks[user_key] = asyncio.create_task(
-                    self._handle_timeout(user_key, timeout_sec)
-                )
-                
                 log_operation("准备上传", True, {"category_name": category, "user_key": user_key})
-                yield event.plain_result(f"请在5分钟内上传.litematic文件到{category}分类")
+                yield event.plain_result(f"请在{_UPLOAD_TIMEOUT_SEC // 60}分钟内上传.litematic文件到{category}分类")
             except Exception as e:
                 log_error(e, extra_info={"category_name": category, "operation": "设置上传状态"})
                 yield event.plain_result(f"准备上传时出现错误: {str(e)}")
@@ -119,9 +137,13 @@ class UploadCommand:
         """
         user_key: UserKey = f"{event.session_id}_{event.get_sender_id()}"
         
-        # 验证上传状态
-        if user_key not in self.upload_states:
+        # 清理已过期的上传状态后再验证
+        self._sweep_expired(time.monotonic())
+        upload_state = self.upload_states.get(user_key)
+        if upload_state is None:
             return
+        # 先取出目标分类，下载期间状态可能被其他请求的清理移除
+        category = upload_state.get("category", "default")
         
         try:
             # 处理文件上传
@@ -136,21 +158,22 @@ class UploadCommand:
                             for msg_item in message_list:
                                 if isinstance(msg_item, dict) and msg_item.get('type') == 'file':
                                     file_data = msg_item.get('data', {})
-                                    file_name = file_data.get('file')
-                                    if file_name and file_name.endswith('.litematic'):
-                                        filename = file_name
+                                    filename = _normalize_litematic_name(file_data.get('file'))
+                                    if filename:
                                         logger.info(f"成功获取文件名: {filename}")
                                         break
                     except Exception as e:
                         logger.warning(f"获取文件名失败: {e}")
                     
-                    # 如果没有获取到文件名，使用默认名称
+                    # 其次使用文件组件自带的名称，都没有时使用默认名称
+                    if not filename:
+                        filename = _normalize_litematic_name(getattr(comp, "name", None))
                     if not filename:
                         logger.warning("未找到有效的litematic文件名，使用默认名称")
                         filename = "uploaded_file.litematic"
                     
                     # 检查是否是litematic文件
-                    if filename.endswith('.litematic'):
+                    if filename.endswith(_LITEMATIC_SUFFIX):
                         # 使用get_file()方法下载文件到本地
                         try:
                             file_path = await comp.get_file()
@@ -158,14 +181,14 @@ class UploadCommand:
                         except Exception as e:
                             logger.error(f"下载文件失败: {e}")
                             yield event.plain_result("文件下载失败，上传终止")
-                            await self._clear_user_state(user_key)
+                            self._clear_user_state(user_key, upload_state)
                             return
                         
-                        category = self.upload_states[user_key].get("category", "default")
-                        
                         try:
                             # 保存文件到目标目录
-                            target_path = await self.file_manager.save_litematic_file_async(file_path, category, filename)
+                            target_path = await self._save_file(file_path, category, filename)
+                            # 同名文件被覆盖时丢弃旧的材料分析结果
+                            invalidate_material_cache(target_path)
                             log_operation("保存文件", True, {"category": category, "file_name": filename, "path": target_path})
                             yield event.plain_result(f"已成功保存litematic文件到{category}分类: {filename}")
                         except FileSaveError as e:
@@ -176,47 +199,62 @@ class UploadCommand:
                             yield event.plain_result(f"保存文件时出现错误: {str(e)}")
                         
                         # 清理用户状态
-                        await self._clear_user_state(user_key)
+                        self._clear_user_state(user_key, upload_state)
                         return
         except Exception as e:
             log_error(e, extra_info={"user_key": user_key, "operation": "处理文件上传"})
             yield event.plain_result(f"处理文件上传时出现错误: {str(e)}")
             # 出错时也清理状态
-            await self._clear_user_state(user_key)
+            self._clear_user_state(user_key, upload_state)
         return
     
-    async def _handle_timeout(self, user_key: UserKey, timeout_sec: int) -> None:
+    async def _save_file(self, file_path: str, category: CategoryType, filename: str) -> str:
         """
-        处理上传超时
+        在线程池中保存上传的文件，不阻塞事件循环
+        
+        上传集中到来时使用插件自己的线程池，避免占满默认线程池影响其他命令
         
         Args:
-            user_key: 用户标识
-            timeout_sec: 超时秒数
+            file_path: 下载到本地的文件路径
+            category: 目标分类
+            filename: 文件名
+            
+        Returns:
+            str: 目标文件路径
+            
+        Raises:
+            FileSaveError: 文件保存失败
         """
-        try:
-            await asyncio.sleep(timeout_sec)
-            # 如果用户状态仍存在，则说明超时了
-            if user_key in self.upload_states:
-                log_operation("上传超时", False, {"user_key": user_key})
-                del self.upload_states[user_key]
-        except asyncio.CancelledError:
-            # 任务被取消，正常情况（例如用户完成了上传）
-            pass
-        except Exception as e:
-            log_error(e, extra_info={"user_key": user_key, "operation": "处理超时"})
+        if self.executor is None:
+            return await self.file_manager.save_litematic_file_async(file_path, category, filename)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.file_manager.save_litematic_file, file_path, category, filename
+        )
     
-    async def _clear_user_state(self, user_key: UserKey) -> None:
+    def _sweep_expired(self, now: float) -> None:
         """
-        清理用户状态和相关任务
+        从队首清理所有已过期的上传状态
+        
+        Args:
+            now: 当前时间（time.monotonic）
+        """
+        while self.upload_states:
+            user_key, status = next(iter(self.upload_states.items()))
+            if status["expire_time"] > now:
+                break
+            self.upload_states.popitem(last=False)
+            log_operation("上传超时", False, {"user_key": user_key})
+    
+    def _clear_user_state(self, user_key: UserKey, upload_state: UploadStatus) -> None:
+        """
+        清理用户上传状态
+        
+        下载和保存期间用户可能重新执行了上传命令，此时状态已被替换为新的，只清理本次处理的状态
         
         Args:
             user_key: 用户标识
+            upload_state: 本次上传处理开始时取得的状态
         """
-        # 删除上传状态
-        if user_key in self.upload_states:
+        if self.upload_states.get(user_key) is upload_state:
             del self.upload_states[user_key]
-        
-        # 取消超时任务
-        if user_key in self.timeout_tasks and not self.timeout_tasks[user_key].done():
-            self.timeout_tasks[user_key].cancel()
-            del self.timeout_tasks[user_key] 
@@ -1,5 +1,4 @@
 from litemapy import Schematic
-import collections
 from typing import List, Optional
 
 class DetailAnalysis:
@@ -24,19 +23,21 @@ class DetailAnalysis:
         # 使用已加载的schematic
         schem = self.schematic
         
-        # 确保details是一个列表
-        self.details = []
-        self.details.append(f"投影名称: {schem.name}")
-        self.details.append(f"投影作者: {schem.author}")
-        self.details.append(f"投影描述: {schem.description}")
+        # 基本信息一次构建为列表
+        self.details = [
+            f"投影名称: {schem.name}",
+            f"投影作者: {schem.author}",
+            f"投影描述: {schem.description}"
+        ]
         
-        # 添加更多信息
-        if hasattr(schem, 'regions') and schem.regions:
-            self.details.append(f"区域数量: {len(schem.regions)}")
-            
-            # 添加区域信息
-            for region_name, region in schem.regions.items():
-                self.details.append(f"区域 {region_name}: {region.width}×{region.height}×{region.length}")
+        # 添加区域数量和每个区域的尺寸
+        regions = getattr(schem, 'regions', None)
+        if regions:
+            self.details.append(f"区域数量: {len(regions)}")
+            self.details.extend(
+                f"区域 {region_name}: {region.width}×{region.height}×{region.length}"
+                for region_name, region in regions.items()
+            )
         
         return self.details
 
@@ -1,34 +1,40 @@
-from .render2D import Render2D
-from .build_model import World, Block
-from .render_engine import RenderEngine, RenderOptions
-from .texture_manager import TextureManager
-from .config_loader import ConfigLoader
-from .projection import Projection
-from .render_facade import RenderFacade
+import importlib
+from typing import Any, Dict
 
-# 导出渲染管道相关组件
-from .interfaces import RenderContext, IRenderProcessor, IRenderPipeline
-from .render_pipeline import RenderPipeline, AbstractRenderProcessor
-from .render_processors import (
-    BoundsCalculatorProcessor, 
-    TextureLoaderProcessor, 
-    TopViewProcessor, 
-    FrontViewProcessor, 
-    SideViewProcessor, 
-    ViewCombinerProcessor
-)
-
-# 导出视图组合器相关组件
-from .view_combiner import (
-    ViewCombiner,
-    LayoutType,
-    IViewLayout,
-    VerticalLayout,
-    HorizontalLayout,
-    GridLayout,
-    StackedLayout,
-    CustomCombinedLayout
-)
+# 导出名称到所在子模块的映射，首次访问时才导入对应子模块（PEP 562），
+# 避免只使用部分功能时在插件加载阶段就导入PIL等全部渲染依赖
+_LAZY_IMPORTS: Dict[str, str] = {
+    'Render2D': '.render2D',
+    'World': '.build_model',
+    'Block': '.build_model',
+    'RenderEngine': '.render_engine',
+    'RenderOptions': '.render_engine',
+    'TextureManager': '.texture_manager',
+    'ConfigLoader': '.config_loader',
+    'Projection': '.projection',
+    'RenderFacade': '.render_facade',
+    # 渲染管道相关
+    'RenderContext': '.interfaces',
+    'IRenderProcessor': '.interfaces',
+    'IRenderPipeline': '.interfaces',
+    'RenderPipeline': '.render_pipeline',
+    'AbstractRenderProcessor': '.render_pipeline',
+    'BoundsCalculatorProcessor': '.render_processors',
+    'TextureLoaderProcessor': '.render_processors',
+    'TopViewProcessor': '.render_processors',
+    'FrontViewProcessor': '.render_processors',
+    'SideViewProcessor': '.render_processors',
+    'ViewCombinerProcessor': '.render_processors',
+    # 视图组合器相关
+    'ViewCombiner': '.view_combiner',
+    'LayoutType': '.view_combiner',
+    'IViewLayout': '.view_combiner',
+    'VerticalLayout': '.view_combiner',
+    'HorizontalLayout': '.view_combiner',
+    'GridLayout': '.view_combiner',
+    'StackedLayout': '.view_combiner',
+    'CustomCombinedLayout': '.view_combiner'
+}
 
 __all__ = [
     'Render2D',
@@ -61,4 +67,18 @@ __all__ = [
     'GridLayout',
     'StackedLayout',
     'CustomCombinedLayout'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入导出的组件，导入后缓存到模块属性中"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,81 +1,120 @@
+import sys
+import numpy as np
+from itertools import chain
 from litemapy import Schematic
-from collections import defaultdict
-from typing import Dict, List, Optional, Callable, Any, Set, DefaultDict, Union, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 
 # 自定义类型别名
-BlockPosition = List[int]  # [x, y, z]
-BlockMap = DefaultDict[int, DefaultDict[int, Dict[int, 'Block']]]
+BlockPosition = Tuple[int, int, int]  # (x, y, z)
+# 投影索引: (行坐标最小值, 列坐标最小值, 二维方块下标数组，-1表示该位置没有方块)
+ExtremeIndex = Tuple[int, int, np.ndarray]
+# 投影视图中可见方块的数组形式: (行坐标数组, 列坐标数组, 方块在blocks中的下标数组)
+ViewCells = Tuple[np.ndarray, np.ndarray, np.ndarray]
+# 方块种类: (每个方块的种类编号数组, 每种(名称, 朝向)的代表方块列表)
+BlockKinds = Tuple[np.ndarray, List['Block']]
 FacingMapping = Dict[str, Dict[str, str]]
-TextureMapping = Dict[str, str]
+# 材质面映射: 依次为顶视图、前视图、侧视图、底视图使用的材质面
+TextureFaces = Tuple[str, str, str, str]
+
+# 视图名称到材质面映射元组下标的映射
+_VIEW_INDEX: Dict[str, int] = {'top': 0, 'front': 1, 'side': 2, 'bottom': 3}
+
+# 默认材质面映射，所有方块共享同一个元组
+_DEFAULT_TEXTURE_FACES: TextureFaces = (
+    'top',      # 顶视图使用top材质
+    'side',     # 前视图使用side材质
+    'side',     # 侧视图使用side材质
+    'bottom'    # 底视图使用bottom材质
+)
+
+# 表示方块朝向的属性名，按优先级排列
+_FACING_KEYS: Tuple[str, ...] = ('facing', 'rotation', 'axis')
+
+# 楼梯、门、活塞按朝向覆盖的材质面映射
+_STAIRS_FACING_MAPPINGS: FacingMapping = {
+    "north": {'front': 'front', 'side': 'side'},
+    "south": {'front': 'back', 'side': 'side'},
+    "east": {'front': 'side', 'side': 'front'},
+    "west": {'front': 'side', 'side': 'back'}
+}
+_DOOR_FACING_MAPPINGS: FacingMapping = {
+    "north": {'front': 'front'},
+    "south": {'front': 'back'},
+    "east": {'side': 'front'},
+    "west": {'side': 'back'}
+}
+_PISTON_FACING_MAPPINGS: FacingMapping = {
+    "up": {'top': 'front'},
+    "down": {'bottom': 'front'},
+    "north": {'front': 'front'},
+    "south": {'front': 'back'},
+    "east": {'side': 'front'},
+    "west": {'side': 'back'}
+}
 
 class Block:
     """表示Minecraft世界中的一个方块，包含位置、类型、朝向和材质信息"""
     
+    # 大型投影会创建大量方块对象，使用__slots__去掉每个实例的__dict__以减少内存占用
+    __slots__ = ('name', 'position', 'facing', 'texture', 'model_data', 'texture_faces')
+    
+    # 特殊方块的材质面映射缓存，键为(方块类别, 朝向)，相同类别和朝向的方块共享同一个元组
+    _MAPPING_CACHE: Dict[Tuple[str, Optional[str]], TextureFaces] = {}
+    
     def __init__(self, name: str, position: BlockPosition, facing: Optional[str] = None, texture: Optional[str] = None) -> None:
         self.name: str = name
-        self.position: BlockPosition = position  # [x, y, z]
+        self.position: BlockPosition = position  # (x, y, z)
         self.facing: Optional[str] = facing
         self.texture: Optional[str] = texture
+        # 方块模型数据，渲染时按需加载
+        self.model_data: Optional[Dict[str, Any]] = None
         
-        # 材质面映射关系
-        self.texture_mappings: TextureMapping = {}
-        
-        self._set_default_mappings()
+        # 材质面映射，默认引用共享的元组，不再为每个方块创建字典
+        self.texture_faces: TextureFaces = _DEFAULT_TEXTURE_FACES
     
     def _set_default_mappings(self) -> None:
         """设置默认的材质面映射关系"""
-        self.texture_mappings = {
-            'top': 'top',         # 顶视图使用top材质
-            'front': 'side',      # 前视图使用side材质
-            'side': 'side',       # 侧视图使用side材质
-            'bottom': 'bottom'    # 底视图使用bottom材质
-        }
+        self.texture_faces = _DEFAULT_TEXTURE_FACES
+    
+    def _use_shared_mappings(self, kind: str, overrides: Optional[Dict[str, str]]) -> None:
+        """在默认映射上应用覆盖项，并使用按(类别, 朝向)缓存的共享映射
+        
+        Args:
+            kind: 方块类别
+            overrides: 需要覆盖的材质面映射，为None时保持当前映射
+        """
+        if overrides is None:
+            return
+        key = (kind, self.facing)
+        faces = Block._MAPPING_CACHE.get(key)
+        if faces is None:
+            merged = list(_DEFAULT_TEXTURE_FACES)
+            for view, face in overrides.items():
+                merged[_VIEW_INDEX[view]] = face
+            faces = tuple(merged)
+            Block._MAPPING_CACHE[key] = faces
+        self.texture_faces = faces
     
     def _apply_stairs_mappings(self) -> None:
         """应用楼梯方块的材质映射"""
-        facing_mappings: FacingMapping = {
-            "north": {'front': 'front', 'side': 'side'},
-            "south": {'front': 'back', 'side': 'side'},
-            "east": {'front': 'side', 'side': 'front'},
-            "west": {'front': 'side', 'side': 'back'}
-        }
-        
-        if self.facing in facing_mappings:
-            self.texture_mappings.update(facing_mappings[self.facing])
+        self._use_shared_mappings("stairs", _STAIRS_FACING_MAPPINGS.get(self.facing))
     
     def _apply_door_mappings(self) -> None:
         """应用门类方块的材质映射"""
-        facing_mappings: FacingMapping = {
-            "north": {'front': 'front'},
-            "south": {'front': 'back'},
-            "east": {'side': 'front'},
-            "west": {'side': 'back'}
-        }
-        
-        if self.facing in facing_mappings:
-            self.texture_mappings.update(facing_mappings[self.facing])
+        self._use_shared_mappings("door", _DOOR_FACING_MAPPINGS.get(self.facing))
     
     def _apply_piston_mappings(self) -> None:
         """应用活塞类方块的材质映射"""
-        facing_mappings: FacingMapping = {
-            "up": {'top': 'front'},
-            "down": {'bottom': 'front'},
-            "north": {'front': 'front'},
-            "south": {'front': 'back'},
-            "east": {'side': 'front'},
-            "west": {'side': 'back'}
-        }
-        
-        if self.facing in facing_mappings:
-            self.texture_mappings.update(facing_mappings[self.facing])
+        self._use_shared_mappings("piston", _PISTON_FACING_MAPPINGS.get(self.facing))
     
     def _apply_redstone_component_mappings(self) -> None:
         """应用红石元件的材质映射"""
-        self.texture_mappings['top'] = f'top_{self.facing}'
+        self._use_shared_mappings("redstone", {'top': f'top_{self.facing}'})
     
     def get_texture_face(self, view: str) -> str:
-        """获取指定视图对应的材质面"""
-        return self.texture_mappings.get(view, view)
+        """获取指定视图对应的材质面，未知视图直接使用视图名称"""
+        index = _VIEW_INDEX.get(view)
+        return view if index is None else self.texture_faces[index]
 
 
 class World:
@@ -83,109 +122,304 @@ class World:
     
     def __init__(self) -> None:
         self.blocks: List[Block] = []
-        self.block_map_xzy: BlockMap = defaultdict(lambda: defaultdict(dict))
-        self.block_map_yzx: BlockMap = defaultdict(lambda: defaultdict(dict))
-        self.block_map_zyx: BlockMap = defaultdict(lambda: defaultdict(dict))
+        # 方块坐标数组 (N, 3)，int32连续存储，行顺序与blocks一致，首次查询时由blocks生成
+        self._positions: Optional[np.ndarray] = None
+        # 投影索引缓存，键为(行轴, 列轴, 深度轴, 是否取最大值)
+        self._extreme_indices: Dict[Tuple[int, int, int, bool], ExtremeIndex] = {}
+        # 方块种类缓存，首次查询时由blocks生成
+        self._kinds: Optional[BlockKinds] = None
     
     def add_blocks(self, schem: Schematic) -> None:
         """从Schematic中添加方块到世界"""
+        blocks = self.blocks
+        # 循环内用到的方法提前绑定为局部变量，减少每个方块的属性查找
+        append_block = blocks.append
+        get_facing = self._get_block_facing
         for region_name, region in schem.regions.items():
-            for x, y, z in region.block_positions():
-                block = region[x, y, z]
-                
-                # 跳过空气方块
-                if block is None or block.id == "minecraft:air":
-                    continue
+            # 区域内相同状态的方块共用调色板中的同一个BlockState对象，
+            # 按对象缓存方块ID和朝向，每种状态只解析一次；缓存同时持有对象引用，避免id被复用
+            state_cache: Dict[int, Tuple[Any, Optional[Tuple[str, Optional[str]]]]] = {}
+            lookup_state = state_cache.get
+            get_block = region.__getitem__
+            for position in region.block_positions():
+                # 坐标元组直接作为索引，等价于region[x, y, z]
+                block = get_block(position)
                 
-                # 获取方块方向属性
-                facing = self._get_block_facing(block)
+                cached = lookup_state(id(block))
+                if cached is None:
+                    # 空气方块记为None，之后直接跳过
+                    if block is None or block.id == "minecraft:air":
+                        info = None
+                    else:
+                        # 名称和朝向字符串驻留，相同内容共用同一个对象，作为字典键比较时可直接按身份判断
+                        info = (sys.intern(block.id), get_facing(block))
+                    cached = (block, info)
+                    state_cache[id(block)] = cached
                 
-                new_block = Block(
-                    name=block.id,
-                    position=[x, y, z],
-                    facing=facing,
-                    texture=None
-                )
+                info = cached[1]
+                if info is None:
+                    continue
                 
-                self.blocks.append(new_block)
-                self._add_block_to_indices(new_block, x, y, z)
+                # block_positions()产生的坐标本身就是元组，tuple()不会复制，方块直接共用该元组
+                append_block(Block(info[0], tuple(position), info[1]))
+        
+        # 方块集合变化后索引需要重建
+        self._positions = None
+        self._extreme_indices.clear()
+        self._kinds = None
     
     def _get_block_facing(self, block: Any) -> Optional[str]:
         """从方块对象中提取朝向信息"""
-        if not hasattr(block, '_BlockState__properties'):
+        properties = getattr(block, '_BlockState__properties', None)
+        if not properties:
             return None
+        
+        # 直接读取属性字典，不再经过BlockState的__getitem__
+        for prop in _FACING_KEYS:
+            value = properties.get(prop)
+            if value is not None:
+                return sys.intern(value) if isinstance(value, str) else value
+        
+        return None
+    
+    def get_positions(self) -> np.ndarray:
+        """获取所有方块坐标组成的(N, 3) int32数组，行顺序与blocks一致
+        
+        Returns:
+            np.ndarray: 方块坐标数组，每行为[x, y, z]
+        """
+        if self._positions is None:
+            blocks = self.blocks
+            self._positions = np.fromiter(
+                chain.from_iterable(block.position for block in blocks),
+                dtype=np.int32,
+                count=3 * len(blocks)
+            ).reshape(-1, 3)
+        return self._positions
+    
+    def get_block_kinds(self) -> BlockKinds:
+        """按(名称, 朝向)给方块分组编号，相同种类的方块使用相同的材质面
+        
+        Returns:
+            BlockKinds: 与blocks顺序一致的int32种类编号数组，以及每个种类的代表方块列表
+        """
+        if self._kinds is None:
+            kind_index: Dict[Tuple[str, Optional[str]], int] = {}
+            kinds: List[Block] = []
+            
+            def kind_of(block: Block) -> int:
+                key = (block.name, block.facing)
+                kind = kind_index.get(key)
+                if kind is None:
+                    kind = kind_index[key] = len(kinds)
+                    kinds.append(block)
+                return kind
+            
+            blocks = self.blocks
+            kind_ids = np.fromiter((kind_of(block) for block in blocks), dtype=np.int32, count=len(blocks))
+            self._kinds = (kind_ids, kinds)
+        return self._kinds
+    
+    def get_slice_blocks(self, axis: int, value: int) -> List[Block]:
+        """获取指定轴坐标等于给定值的所有方块，保持添加顺序
+        
+        在坐标数组上一次筛选，不再逐个遍历方块对象
+        
+        Args:
+            axis: 坐标轴 (0=x, 1=y, 2=z)
+            value: 坐标值
+            
+        Returns:
+            List[Block]: 位于该平面上的方块列表
+        """
+        positions = self.get_positions()
+        blocks = self.blocks
+        return [blocks[i] for i in np.flatnonzero(positions[:, axis] == value).tolist()]
+    
+    def get_bounds(self) -> Tuple[int, int, int, int, int, int]:
+        """获取结构的边界坐标，没有方块时返回全0
+        
+        Returns:
+            Tuple[int, int, int, int, int, int]: (min_x, max_x, min_y, max_y, min_z, max_z)
+        """
+        positions = self.get_positions()
+        if len(positions) == 0:
+            return (0, 0, 0, 0, 0, 0)
+        
+        mins = positions.min(axis=0)
+        maxs = positions.max(axis=0)
+        return (int(mins[0]), int(maxs[0]), int(mins[1]), int(maxs[1]), int(mins[2]), int(maxs[2]))
+    
+    def _get_extreme_index(self, row_axis: int, col_axis: int, depth_axis: int, take_max: bool) -> ExtremeIndex:
+        """获取沿深度轴取最小/最大坐标的投影索引，首次使用时用NumPy一次性构建
+        
+        对每个(行, 列)坐标，记录深度坐标最小（或最大）的方块在blocks中的下标。
+        同一位置有多个方块时保留后添加的方块，与逐个写入字典索引时的覆盖行为一致。
+        
+        Args:
+            row_axis: 行坐标所在的轴 (0=x, 1=y, 2=z)
+            col_axis: 列坐标所在的轴
+            depth_axis: 深度坐标所在的轴
+            take_max: 是否取深度最大的方块
             
-        facing_properties: List[str] = ['facing', 'rotation', 'axis']
-        for prop in facing_properties:
-            if prop in block._BlockState__properties:
-                return block[prop]
+        Returns:
+            ExtremeIndex: 行坐标最小值、列坐标最小值和二维方块下标数组
+        """
+        key = (row_axis, col_axis, depth_axis, take_max)
+        cached = self._extreme_indices.get(key)
+        if cached is not None:
+            return cached
+        
+        positions = self.get_positions()
+        
+        if len(positions) == 0:
+            index: ExtremeIndex = (0, 0, np.full((0, 0), -1, dtype=np.int32))
+            self._extreme_indices[key] = index
+            return index
+        
+        # 转为int64计算格子编号，避免大尺寸投影时溢出
+        rows = positions[:, row_axis].astype(np.int64)
+        cols = positions[:, col_axis].astype(np.int64)
+        row_min = int(rows.min())
+        col_min = int(cols.min())
+        width = int(cols.max()) - col_min + 1
+        cells = (rows - row_min) * width + (cols - col_min)
+        
+        height = int(rows.max()) - row_min + 1
+        depth = positions[:, depth_axis]
+        
+        # 两次线性的分组归约代替排序：先求每个格子的最小/最大深度，
+        # 再在达到该深度的方块中取下标最大的，即同深度时后添加的方块优先
+        if take_max:
+            best_depth = np.full(height * width, np.iinfo(np.int32).min, dtype=np.int32)
+            np.maximum.at(best_depth, cells, depth)
+        else:
+            best_depth = np.full(height * width, np.iinfo(np.int32).max, dtype=np.int32)
+            np.minimum.at(best_depth, cells, depth)
+        at_extreme = depth == best_depth[cells]
         
+        grid = np.full(height * width, -1, dtype=np.int32)
+        np.maximum.at(grid, cells[at_extreme], np.flatnonzero(at_extreme).astype(np.int32))
+        grid = grid.reshape(height, width)
+        
+        index = (row_min, col_min, grid)
+        self._extreme_indices[key] = index
+        return index
+    
+    def _lookup_extreme(self, key: Tuple[int, int, int, bool], row: int, col: int) -> Optional[Block]:
+        """在投影索引中查找指定(行, 列)坐标的方块"""
+        row_min, col_min, grid = self._get_extreme_index(*key)
+        r = row - row_min
+        c = col - col_min
+        if 0 <= r < grid.shape[0] and 0 <= c < grid.shape[1]:
+            i = grid[r, c]
+            if i >= 0:
+                return self.blocks[i]
         return None
     
-    def _add_block_to_indices(self, block: Block, x: int, y: int, z: int) -> None:
-        """将方块添加到各个索引结构中"""
-        self.block_map_xzy[x][z][y] = block
-        self.block_map_yzx[y][z][x] = block
-        self.block_map_zyx[z][y][x] = block
+    def _cells_in_range(self, key: Tuple[int, int, int, bool], row_start: int, row_end: int,
+                        col_start: int, col_end: int, transpose: bool = False) -> ViewCells:
+        """取出投影索引在(行, 列)闭区间内所有有方块的位置，按先行后列的顺序排列
+        
+        只在NumPy中筛选一次有方块的位置，结果保持数组形式
+        
+        Args:
+            key: 投影索引的键 (行轴, 列轴, 深度轴, 是否取最大值)
+            row_start: 行坐标起点
+            row_end: 行坐标终点（包含）
+            col_start: 列坐标起点
+            col_end: 列坐标终点（包含）
+            transpose: 是否转置索引，为True时以索引的列轴作为结果的行，复用同一份索引得到另一种遍历顺序
+            
+        Returns:
+            ViewCells: 行坐标数组、列坐标数组和方块下标数组
+        """
+        row_min, col_min, grid = self._get_extreme_index(*key)
+        if transpose:
+            grid = grid.T
+            row_min, col_min = col_min, row_min
+        r0 = max(row_start - row_min, 0)
+        r1 = min(row_end - row_min + 1, grid.shape[0])
+        c0 = max(col_start - col_min, 0)
+        c1 = min(col_end - col_min + 1, grid.shape[1])
+        if r0 >= r1 or c0 >= c1:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty, empty
+        
+        window = grid[r0:r1, c0:c1]
+        rows, cols = np.nonzero(window >= 0)
+        indices = window[rows, cols].astype(np.intp)
+        return rows + (r0 + row_min), cols + (c0 + col_min), indices
+    
+    def _blocks_in_range(self, key: Tuple[int, int, int, bool], row_start: int, row_end: int,
+                         col_start: int, col_end: int, transpose: bool = False) -> List[Tuple[int, int, Block]]:
+        """批量取出投影索引在(行, 列)闭区间内的所有方块，按先行后列的顺序排列
+        
+        与逐个坐标调用_lookup_extreme的结果相同
+        
+        Args:
+            key: 投影索引的键 (行轴, 列轴, 深度轴, 是否取最大值)
+            row_start: 行坐标起点
+            row_end: 行坐标终点（包含）
+            col_start: 列坐标起点
+            col_end: 列坐标终点（包含）
+            transpose: 是否转置索引
+            
+        Returns:
+            List[Tuple[int, int, Block]]: (行坐标, 列坐标, 方块) 列表
+        """
+        rows, cols, indices = self._cells_in_range(key, row_start, row_end, col_start, col_end, transpose)
+        blocks = self.blocks
+        return [
+            (r, c, blocks[i])
+            for r, c, i in zip(rows.tolist(), cols.tolist(), indices.tolist())
+        ]
+    
+    def get_top_cells(self, min_x: int, max_x: int, min_z: int, max_z: int) -> ViewCells:
+        """与get_top_blocks相同，但返回(x数组, z数组, 方块下标数组)"""
+        return self._cells_in_range((0, 2, 1, True), min_x, max_x, min_z, max_z)
+    
+    def get_front_cells(self, min_x: int, max_x: int, min_y: int, max_y: int) -> ViewCells:
+        """与get_front_blocks相同，但返回(x数组, y数组, 方块下标数组)"""
+        return self._cells_in_range((0, 1, 2, False), min_x, max_x, min_y, max_y)
+    
+    def get_side_cells(self, min_z: int, max_z: int, min_y: int, max_y: int) -> ViewCells:
+        """与get_side_blocks相同，但返回(z数组, y数组, 方块下标数组)"""
+        return self._cells_in_range((1, 2, 0, True), min_z, max_z, min_y, max_y, transpose=True)
+    
+    def get_top_blocks(self, min_x: int, max_x: int, min_z: int, max_z: int) -> List[Tuple[int, int, Block]]:
+        """获取区域内每个x,z坐标上y值最大的方块，返回(x, z, 方块)列表"""
+        return self._blocks_in_range((0, 2, 1, True), min_x, max_x, min_z, max_z)
+    
+    def get_front_blocks(self, min_x: int, max_x: int, min_y: int, max_y: int) -> List[Tuple[int, int, Block]]:
+        """获取区域内每个x,y坐标上z值最小的方块，返回(x, y, 方块)列表"""
+        return self._blocks_in_range((0, 1, 2, False), min_x, max_x, min_y, max_y)
+    
+    def get_side_blocks(self, min_z: int, max_z: int, min_y: int, max_y: int) -> List[Tuple[int, int, Block]]:
+        """获取区域内每个z,y坐标上x值最大的方块，返回(z, y, 方块)列表"""
+        # 复用get_max_x_at的(y, z)索引并转置，结果按先z后y排列，不再单独建立(z, y)索引
+        return self._blocks_in_range((1, 2, 0, True), min_z, max_z, min_y, max_y, transpose=True)
     
     def get_min_y_at(self, x: int, z: int) -> Optional[Block]:
         """获取指定x,z坐标上的最小y值的方块"""
-        if x in self.block_map_xzy and z in self.block_map_xzy[x]:
-            y_values = self.block_map_xzy[x][z].keys()
-            if y_values:
-                min_y = min(y_values)
-                return self.block_map_xzy[x][z][min_y]
-        return None
+        return self._lookup_extreme((0, 2, 1, False), x, z)
     
     def get_max_y_at(self, x: int, z: int) -> Optional[Block]:
         """获取指定x,z坐标上的最大y值的方块"""
-        if x in self.block_map_xzy and z in self.block_map_xzy[x]:
-            y_values = self.block_map_xzy[x][z].keys()
-            if y_values:
-                max_y = max(y_values)
-                return self.block_map_xzy[x][z][max_y]
-        return None
+        return self._lookup_extreme((0, 2, 1, True), x, z)
     
     def get_min_x_at(self, y: int, z: int) -> Optional[Block]:
         """获取指定y,z坐标上的最小x值的方块"""
-        if y in self.block_map_yzx and z in self.block_map_yzx[y]:
-            x_values = self.block_map_yzx[y][z].keys()
-            if x_values:
-                min_x = min(x_values)
-                return self.block_map_yzx[y][z][min_x]
-        return None
+        return self._lookup_extreme((1, 2, 0, False), y, z)
     
     def get_max_x_at(self, y: int, z: int) -> Optional[Block]:
         """获取指定y,z坐标上的最大x值的方块"""
-        if y in self.block_map_yzx and z in self.block_map_yzx[y]:
-            x_values = self.block_map_yzx[y][z].keys()
-            if x_values:
-                max_x = max(x_values)
-                return self.block_map_yzx[y][z][max_x]
-        return None
+        return self._lookup_extreme((1, 2, 0, True), y, z)
     
     def get_min_z_at(self, x: int, y: int) -> Optional[Block]:
         """获取指定x,y坐标上的最小z值的方块"""
-        if y in self.block_map_yzx and x in self.block_map_yzx[y]:
-            z_values: List[int] = []
-            for z in self.block_map_yzx[y]:
-                if x in self.block_map_yzx[y][z]:
-                    z_values.append(z)
-            
-            if z_values:
-                min_z = min(z_values)
-                return self.block_map_yzx[y][min_z][x]
-        return None
+        return self._lookup_extreme((0, 1, 2, False), x, y)
     
     def get_max_z_at(self, x: int, y: int) -> Optional[Block]:
         """获取指定x,y坐标上的最大z值的方块"""
-        if y in self.block_map_yzx and x in self.block_map_yzx[y]:
-            z_values: List[int] = []
-            for z in self.block_map_yzx[y]:
-                if x in self.block_map_yzx[y][z]:
-                    z_values.append(z)
-            
-            if z_values:
-                max_z = max(z_values)
-                return self.block_map_yzx[y][max_z][x]
-        return None
\ No newline at end of file
+        return self._lookup_extreme((0, 1, 2, True), x, y)
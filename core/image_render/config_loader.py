@@ -1,11 +1,16 @@
 import os
+import copy
 import json
+from astrbot import logger
 
 class ConfigLoader:
     """
     配置加载器，负责加载和处理资源包配置文件。
     """
     
+    # 按资源基础路径缓存的实例
+    _instances = {}
+    
     def __init__(self, resource_base_path="./resource"):
         """
         初始化配置加载器。
@@ -14,12 +19,13 @@ class ConfigLoader:
             resource_base_path (str): 资源基础路径，默认为"./resource"
         """
         self.resource_base_path = resource_base_path
-        self._instance = None
+        # 资源包配置缓存: (文件修改时间, 配置数据)，文件未变化时不重新解析
+        self._resourcepack_cache = None
     
     @classmethod
     def get_instance(cls, resource_base_path="./resource"):
         """
-        获取配置加载器的单例实例。
+        获取配置加载器的单例实例，每个资源基础路径对应一个实例。
         
         参数:
             resource_base_path (str): 资源基础路径
@@ -27,25 +33,36 @@ class ConfigLoader:
         返回:
             ConfigLoader: 配置加载器实例
         """
-        if not hasattr(cls, '_instance') or cls._instance is None:
-            cls._instance = cls(resource_base_path)
-        return cls._instance
+        instance = cls._instances.get(resource_base_path)
+        if instance is None:
+            instance = cls(resource_base_path)
+            cls._instances[resource_base_path] = instance
+        return instance
     
     def load_resourcepack_config(self):
         """
-        加载资源包配置文件。
+        加载资源包配置文件，文件修改时间不变时复用上次解析的结果。
         
         返回:
-            dict: 资源包配置信息
+            dict: 资源包配置信息（副本，调用方可以修改）
         """
         config_path = os.path.join(self.resource_base_path, "resourcepack.json")
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return self._get_default_resourcepack_config()
-        except Exception:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            logger.warning(f"资源包配置文件不存在: {config_path}，使用默认配置")
             return self._get_default_resourcepack_config()
+        
+        cached = self._resourcepack_cache
+        if cached is None or cached[0] != mtime_ns:
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    cached = (mtime_ns, json.load(f))
+            except Exception as e:
+                logger.error(f"加载资源包配置失败: {str(e)}，使用默认配置")
+                return self._get_default_resourcepack_config()
+            self._resourcepack_cache = cached
+        return copy.deepcopy(cached[1])
     
     def _get_default_resourcepack_config(self):
         """
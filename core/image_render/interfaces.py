@@ -55,6 +55,9 @@ T = TypeVar('T')  # 定义泛型类型变量
 class RenderContext:
     """渲染上下文，用于在渲染管道中传递状态和数据"""
     
+    # 数据都保存在_data字典中，不需要实例__dict__
+    __slots__ = ('_data',)
+    
     def __init__(self) -> None:
         """初始化渲染上下文"""
         self._data: Dict[str, Any] = {}
@@ -1,12 +1,29 @@
 import os
 import json
-from typing import Dict, List, Any, Optional, Union
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Any, Mapping, Optional, Union
 from astrbot import logger
 from ...utils.types import BlockModelData
 
+# orjson为可选依赖，解析模型JSON更快，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ModelLoader:
     """处理方块模型数据加载和解析"""
     
+    # 按模型目录共享的缓存，每次渲染新建的加载器可以直接复用之前解析好的模型
+    # 模型名称到解析完继承关系的模型数据，找不到模型的名称缓存为None，不再重复查找
+    _MODEL_CACHES: ClassVar[Dict[str, Dict[str, Optional[Dict[str, Any]]]]] = {}
+    # 父模型名称到解析完继承关系的父模型数据，多个模型共用的父模型（如cube_all）只读取一次；
+    # 缓存的父模型及其textures为只读视图，合并时无需复制也不会被子模型改写
+    _PARENT_CACHES: ClassVar[Dict[str, Dict[str, Optional[Mapping[str, Any]]]]] = {}
+    # 模型目录下按名称排序的json文件名列表，首次查找变体时扫描一次目录
+    _MODEL_FILES: ClassVar[Dict[str, List[str]]] = {}
+    
     def __init__(self, resource_dir: str) -> None:
         """初始化模型加载器
         
@@ -14,8 +31,9 @@ class ModelLoader:
             resource_dir: 资源根目录
         """
         self.resource_dir = resource_dir
-        self.model_cache: Dict[str, Any] = {}
         self.models_dir = os.path.join(resource_dir, "models", "block")
+        self.model_cache: Dict[str, Optional[Dict[str, Any]]] = ModelLoader._MODEL_CACHES.setdefault(self.models_dir, {})
+        self._parent_cache: Dict[str, Optional[Mapping[str, Any]]] = ModelLoader._PARENT_CACHES.setdefault(self.models_dir, {})
         
     def load_model(self, block_id: str) -> Optional[Dict[str, Any]]:
         """加载方块模型数据
@@ -35,16 +53,14 @@ class ModelLoader:
             
         # 处理不同的变种模型
         variant_models = self._find_model_variants(model_name)
-        if not variant_models:
-            return None
-            
-        # 加载主模型
-        model_data = self._load_model_file(variant_models[0])
-        if not model_data:
-            return None
-            
-        # 处理parent继承
-        model_data = self._resolve_model_inheritance(model_data)
+        
+        # 加载主模型，找不到或加载失败时也缓存结果（None），同一方块不再重复查找
+        model_data = self._load_model_file(variant_models[0]) if variant_models else None
+        if model_data:
+            # 处理parent继承
+            model_data = self._resolve_model_inheritance(model_data)
+        else:
+            model_data = None
         
         # 缓存并返回
         self.model_cache[model_name] = model_data
@@ -73,20 +89,38 @@ class ModelLoader:
             List[str]: 变体模型文件路径列表
         """
         variants = []
+        files = self._get_model_files()
         
         # 尝试直接匹配
-        base_path = os.path.join(self.models_dir, f"{model_name}.json")
-        if os.path.exists(base_path):
-            variants.append(base_path)
-            
-        # 查找变体模型
-        if os.path.exists(self.models_dir):
-            for file in os.listdir(self.models_dir):
-                if file.startswith(f"{model_name}_") and file.endswith(".json"):
-                    variants.append(os.path.join(self.models_dir, file))
+        base_file = f"{model_name}.json"
+        index = bisect_left(files, base_file)
+        if index < len(files) and files[index] == base_file:
+            variants.append(os.path.join(self.models_dir, base_file))
+        
+        # 查找变体模型 - 文件名已排序，同前缀的文件是连续的一段
+        prefix = f"{model_name}_"
+        index = bisect_left(files, prefix)
+        while index < len(files) and files[index].startswith(prefix):
+            variants.append(os.path.join(self.models_dir, files[index]))
+            index += 1
         
         return variants
     
+    def _get_model_files(self) -> List[str]:
+        """获取模型目录下排序后的json文件名列表，每个目录只扫描一次
+        
+        Returns:
+            List[str]: 排序后的文件名列表，目录不存在时为空列表
+        """
+        files = ModelLoader._MODEL_FILES.get(self.models_dir)
+        if files is None:
+            try:
+                files = sorted(file for file in os.listdir(self.models_dir) if file.endswith(".json"))
+            except OSError:
+                files = []
+            ModelLoader._MODEL_FILES[self.models_dir] = files
+        return files
+    
     def _load_model_file(self, model_path: str) -> Optional[Dict[str, Any]]:
         """加载单个模型文件
         
@@ -94,11 +128,15 @@ class ModelLoader:
             model_path: 模型文件路径
             
         Returns:
-            Optional[Dict[str, Any]]: 模型数据，失败返回None
+            Optional[Dict[str, Any]]: 模型数据，文件不存在或失败返回None
         """
+        # 不先exists再open，直接打开文件，文件不存在时只有一次系统调用
         try:
-            with open(model_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(model_path, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"加载模型文件失败: {model_path}, 错误: {e}")
             return None
@@ -125,37 +163,58 @@ class ModelLoader:
                 parent_name = parent_name[6:]
                 
             # 加载父模型
-            parent_path = os.path.join(self.models_dir, f"{parent_name}.json")
-            if os.path.exists(parent_path):
-                parent_data = self._load_model_file(parent_path)
-                if parent_data:
-                    # 递归处理父模型的继承
-                    parent_data = self._resolve_model_inheritance(parent_data)
-                    
-                    # 合并模型数据
-                    return self._merge_model_data(parent_data, model_data)
+            parent_data = self._load_parent_model(parent_name)
+            if parent_data:
+                # 合并模型数据
+                return self._merge_model_data(parent_data, model_data)
         
         return model_data
     
-    def _merge_model_data(self, parent: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
+    def _load_parent_model(self, parent_name: str) -> Optional[Mapping[str, Any]]:
+        """加载并解析父模型，结果按父模型名称缓存
+        
+        Args:
+            parent_name: 去掉前缀后的父模型名称
+            
+        Returns:
+            Optional[Mapping[str, Any]]: 解析完继承关系的只读父模型数据，不存在或加载失败返回None
+        """
+        if parent_name in self._parent_cache:
+            return self._parent_cache[parent_name]
+        
+        # 不存在的父模型（如内置的block/block）同样缓存为None，之后直接命中缓存
+        parent_data = self._load_model_file(os.path.join(self.models_dir, f"{parent_name}.json"))
+        if parent_data:
+            # 递归处理父模型的继承，冻结后放入缓存
+            parent_data = self._resolve_model_inheritance(parent_data)
+            if "textures" in parent_data:
+                parent_data["textures"] = MappingProxyType(parent_data["textures"])
+            parent_data = MappingProxyType(parent_data)
+        else:
+            parent_data = None
+        
+        self._parent_cache[parent_name] = parent_data
+        return parent_data
+    
+    def _merge_model_data(self, parent: Mapping[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
         """合并父子模型数据
         
         Args:
-            parent: 父模型数据
+            parent: 父模型数据（只读）
             child: 子模型数据
             
         Returns:
             Dict[str, Any]: 合并后的模型数据
         """
-        result = parent.copy()
-        
-        # 合并顶层属性
-        for key, value in child.items():
-            if key == "textures" and "textures" in result:
-                # 合并纹理，但不覆盖已有的
-                result["textures"].update(value)
-            elif key == "elements" or key not in result:
-                # 元素或新属性直接覆盖
-                result[key] = value
+        # 父模型已有的属性保留父模型的值，子模型只补充新属性
+        result = {**child, **parent}
+        
+        # 元素直接使用子模型的
+        if "elements" in child:
+            result["elements"] = child["elements"]
+        
+        # 合并纹理，子模型的同名纹理覆盖父模型；父模型为只读视图，新建字典而不复制其余属性
+        if "textures" in child and "textures" in parent:
+            result["textures"] = {**parent["textures"], **child["textures"]}
         
         return result 
\ No newline at end of file
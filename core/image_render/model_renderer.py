@@ -4,6 +4,36 @@ from typing import Dict, List, Tuple, Any, Optional
 from .texture_manager import TextureManager
 from astrbot import logger  # 添加logger导入
 
+# (视图, 方块朝向) 到纹理顺时针旋转角度的映射，未列出的组合不旋转
+_ROTATION_MAPPING: Dict[Tuple[str, str], int] = {
+    # 俯视图 (top view)
+    ('up', 'north'): 180, ('up', 'east'): 270, ('up', 'south'): 0, ('up', 'west'): 90,
+    # 底视图 (bottom view)
+    ('down', 'north'): 90, ('down', 'east'): 180, ('down', 'south'): 270, ('down', 'west'): 0,
+    # 北视图 (north view)
+    ('north', 'up'): 90, ('north', 'east'): 180, ('north', 'down'): 270, ('north', 'west'): 0,
+    # 南视图 (south view)
+    ('south', 'up'): 90, ('south', 'west'): 180, ('south', 'down'): 270, ('south', 'east'): 0,
+    # 东视图 (east view)
+    ('east', 'up'): 90, ('east', 'south'): 180, ('east', 'down'): 270, ('east', 'north'): 0,
+    # 西视图 (west view)
+    ('west', 'up'): 90, ('west', 'north'): 180, ('west', 'down'): 270, ('west', 'south'): 0,
+}
+
+# 特殊处理：MC常见的面映射
+_VIEW_ALIASES: Dict[str, str] = {
+    'top': 'up',
+    'front': 'north',
+    'side': 'east'
+}
+
+# 顺时针旋转角度对应的无损转置操作，等价于rotate(-角度, expand=True)
+_ROTATION_TRANSPOSE: Dict[int, Image.Transpose] = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90
+}
+
 class ModelRenderer:
     """方块模型渲染器"""
     
@@ -14,6 +44,8 @@ class ModelRenderer:
             texture_manager: 纹理管理器
         """
         self.texture_manager = texture_manager
+        # (纹理id, UV, 旋转角度) 到(原纹理, 剪裁并旋转后的纹理, 是否完全不透明)，保留原纹理引用，避免id被复用
+        self._face_texture_cache: Dict[Tuple[int, Tuple[float, ...], int], Tuple[Image.Image, Image.Image, bool]] = {}
         
     def render_model_face(self, model_data: Dict[str, Any], face_name: str,
                          scale: int = 1) -> Optional[Image.Image]:
@@ -36,6 +68,12 @@ class ModelRenderer:
             size = 16 * scale
             image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
             
+            # 旋转角度只取决于视图类型和方块朝向（不从face_data获取），所有元素共用，循环外计算一次
+            rotation = self._calculate_rotation(face_name, model_data.get("facing", None))
+            
+            # 纹理引用（如#all）到纹理图像的缓存，只在本次渲染内有效
+            resolved_textures: Dict[str, Image.Image] = {}
+            
             # 处理每个元素
             for idx, element in enumerate(model_data["elements"]):
                 try:
@@ -54,12 +92,15 @@ class ModelRenderer:
                         logger.debug(f"元素{idx}的{face_name}面缺少texture字段")
                         continue
                         
-                    # 获取纹理图像
-                    try:
-                        texture = self.get_texture_from_model(model_data, texture_ref)
-                    except Exception as tex_err:
-                        logger.error(f"获取纹理失败 [{texture_ref}]: {str(tex_err)}")
-                        continue
+                    # 获取纹理图像，同一模型内相同的纹理引用只解析一次
+                    texture = resolved_textures.get(texture_ref)
+                    if texture is None:
+                        try:
+                            texture = self.get_texture_from_model(model_data, texture_ref)
+                        except Exception as tex_err:
+                            logger.error(f"获取纹理失败 [{texture_ref}]: {str(tex_err)}")
+                            continue
+                        resolved_textures[texture_ref] = texture
                     
                     # 获取UV坐标，默认为整个纹理
                     uv = face_data.get("uv", [0, 0, 16, 16])
@@ -71,25 +112,13 @@ class ModelRenderer:
                     # 根据面方向计算绘制区域
                     draw_area = self._calculate_face_area(face_name, from_coords, to_coords)
                     
-                    # 剪裁纹理
+                    # 剪裁并旋转纹理，相同纹理、UV和角度的结果只计算一次
                     try:
-                        cropped_texture = self._crop_texture(texture, uv)
+                        cropped_texture, opaque = self._get_face_texture(texture, uv, rotation)
                     except Exception as crop_err:
-                        logger.error(f"裁剪纹理失败: {str(crop_err)}, UV={uv}")
+                        logger.error(f"剪裁或旋转纹理失败: {str(crop_err)}, UV={uv}, rotation={rotation}")
                         continue
                     
-                    # 获取方块朝向（如果有）
-                    block_facing = model_data.get("facing", None)
-                    
-                    # 应用旋转：根据视图类型和方块朝向计算旋转角度，不再直接从face_data获取
-                    rotation = self._calculate_rotation(face_name, block_facing)
-                    if rotation != 0:
-                        try:
-                            cropped_texture = cropped_texture.rotate(-rotation, expand=True)
-                        except Exception as rot_err:
-                            logger.error(f"旋转纹理失败: {str(rot_err)}, rotation={rotation}")
-                            continue
-                    
                     # 缩放纹理
                     if scale != 1:
                         try:
@@ -106,13 +135,16 @@ class ModelRenderer:
                             logger.error(f"缩放纹理失败: {str(scale_err)}, target_size={target_size}")
                             continue
                     
-                    # 合成到画布上
+                    # 合成到画布上，完全不透明的纹理不需要遮罩，直接复制像素
                     try:
-                        image.paste(
-                            cropped_texture,
-                            (round(draw_area[0]), round(draw_area[1])),
-                            cropped_texture
-                        )
+                        if opaque:
+                            image.paste(cropped_texture, (round(draw_area[0]), round(draw_area[1])))
+                        else:
+                            image.paste(
+                                cropped_texture,
+                                (round(draw_area[0]), round(draw_area[1])),
+                                cropped_texture
+                            )
                     except Exception as paste_err:
                         logger.error(f"粘贴纹理失败: {str(paste_err)}, 位置=({round(draw_area[0])}, {round(draw_area[1])})")
                         continue
@@ -168,6 +200,35 @@ class ModelRenderer:
             logger.error(f"获取模型纹理时出错 [{texture_var}]: {str(err)}")
             return self.texture_manager.default_texture
     
+    def _get_face_texture(self, texture: Image.Image, uv: List[float], rotation: int) -> Tuple[Image.Image, bool]:
+        """获取按UV剪裁并旋转后的纹理及其是否完全不透明，结果按纹理、UV和角度缓存
+        
+        Args:
+            texture: 原始纹理
+            uv: UV坐标 [u1, v1, u2, v2]
+            rotation: 顺时针旋转角度 (0/90/180/270)
+            
+        Returns:
+            Tuple[Image.Image, bool]: 剪裁并旋转后的纹理，以及纹理是否完全不透明
+        """
+        key = (id(texture), tuple(uv), rotation)
+        cached = self._face_texture_cache.get(key)
+        if cached is not None:
+            return cached[1], cached[2]
+        
+        face_texture = self._crop_texture(texture, uv)
+        if rotation != 0:
+            # 角度都是90的倍数，用转置代替rotate，不经过仿射重采样
+            transpose = _ROTATION_TRANSPOSE.get(rotation)
+            if transpose is not None:
+                face_texture = face_texture.transpose(transpose)
+            else:
+                face_texture = face_texture.rotate(-rotation, expand=True)
+        
+        opaque = TextureManager.is_opaque(face_texture)
+        self._face_texture_cache[key] = (texture, face_texture, opaque)
+        return face_texture, opaque
+    
     def _crop_texture(self, texture: Image.Image, uv: List[float]) -> Image.Image:
         """根据UV坐标剪裁纹理
         
@@ -251,66 +312,6 @@ class ModelRenderer:
         # 如果没有朝向，不旋转
         if facing is None:
             return 0
-            
-        # 用于计算最终旋转角度的映射
-        rotation_mapping = {
-            # 俯视图 (top view)
-            'up': {
-                'north': 180,    # 北向方块顺时针旋转180度
-                'east': 270,    # 东向方块顺时针旋转270度
-                'south': 0,  # 南向方块顺时针旋转0度
-                'west': 90,   # 西向方块顺时针旋转90度
-            },
-            # 底视图 (bottom view)
-            'down': {
-                'north': 90,  # 北向方块顺时针旋转90度
-                'east': 180,   # 东向方块顺时针旋转180度
-                'south': 270,    # 南向方块顺时针旋转270度
-                'west': 0,    # 西向方块顺时针旋转0度
-            },
-            # 北视图 (north view)
-            'north': {
-                'up': 90,      # 上向方块顺时针旋转90度
-                'east': 180,   # 东向方块顺时针旋转180度
-                'down': 270,  # 下向方块顺时针旋转270度
-                'west': 0,  # 西向方块顺时针旋转0度
-            },
-            # 南视图 (south view)
-            'south': {
-                'up': 90,      # 上向方块顺时针旋转90度
-                'west': 180,   # 西向方块顺时针旋转180度
-                'down': 270,  # 下向方块顺时针旋转270度
-                'east': 0,  # 东向方块顺时针旋转0度
-            },
-            # 东视图 (east view)
-            'east': {
-                'up': 90,      # 上向方块顺时针旋转90度
-                'south': 180,  # 南向方块顺时针旋转180度
-                'down': 270,  # 下向方块顺时针旋转270度
-                'north': 0, # 北向方块顺时针旋转0度
-            },
-            # 西视图 (west view)
-            'west': {
-                'up': 90,      # 上向方块顺时针旋转90度
-                'north': 180,  # 北向方块顺时针旋转180度
-                'down': 270,  # 下向方块顺时针旋转270度
-                'south': 0, # 南向方块顺时针旋转0度
-            }
-        }
         
-        # 特殊处理：MC常见的面映射
-        view_mapping = {
-            'top': 'up',
-            'front': 'north',
-            'side': 'east'
-        }
-        
-        # 应用视图映射
-        mapped_view = view_mapping.get(view, view)
-        
-        # 如果视图类型和朝向组合存在于映射中，返回对应旋转角度
-        if mapped_view in rotation_mapping and facing in rotation_mapping[mapped_view]:
-            return rotation_mapping[mapped_view][facing]
-            
-        # 默认不旋转
-        return 0 
\ No newline at end of file
+        # 查表，视图类型和朝向组合不在映射中时默认不旋转
+        return _ROTATION_MAPPING.get((_VIEW_ALIASES.get(view, view), facing), 0)
@@ -18,114 +18,82 @@ class Projection:
     
     def get_top_view_blocks(self, min_x: int, max_x: int, min_z: int, max_z: int) -> List[VisibleBlockTop]:
         """获取俯视图中可见的方块列表"""
-        visible_blocks: List[VisibleBlockTop] = []
-        
-        for x in range(min_x, max_x + 1):
-            for z in range(min_z, max_z + 1):
-                block = self.world.get_max_y_at(x, z)
-                if block:
-                    visible_blocks.append((x, z, block))
-        
-        return visible_blocks
+        return self.world.get_top_blocks(min_x, max_x, min_z, max_z)
     
     def get_front_view_blocks(self, min_x: int, max_x: int, min_y: int, max_y: int, z: int) -> List[VisibleBlockFront]:
         """获取正视图中可见的方块列表"""
-        visible_blocks: List[VisibleBlockFront] = []
-        
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                block = self.world.get_min_z_at(x, y)
-                if block:
-                    visible_blocks.append((x, y, block))
-        
-        return visible_blocks
+        return self.world.get_front_blocks(min_x, max_x, min_y, max_y)
     
     def get_side_view_blocks(self, min_z: int, max_z: int, min_y: int, max_y: int, x: int) -> List[VisibleBlockSide]:
         """获取侧视图中可见的方块列表"""
-        visible_blocks: List[VisibleBlockSide] = []
-        
-        for z in range(min_z, max_z + 1):
-            for y in range(min_y, max_y + 1):
-                block = self.world.get_max_x_at(y, z)
-                if block:
-                    visible_blocks.append((z, y, block))
-        
-        return visible_blocks
+        return self.world.get_side_blocks(min_z, max_z, min_y, max_y)
     
     def render_top_view(self, texture_manager: TextureManager, min_x: int, max_x: int, 
                         min_z: int, max_z: int, scale: int = 1) -> Image.Image:
         """渲染俯视图"""
-        width = (max_x - min_x + 1) * texture_manager.texture_size
-        height = (max_z - min_z + 1) * texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.get_top_view_blocks(min_x, max_x, min_z, max_z)
-        
-        for x, z, block in visible_blocks:
-            pos_x = (x - min_x) * texture_manager.texture_size
-            pos_z = (z - min_z) * texture_manager.texture_size
-            
-            face = block.get_texture_face('top')
-            texture = texture_manager.get_texture(block.name, face)
-            
-            image.paste(texture, (pos_x, pos_z), texture)
-        
-        if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image
+        xs, zs, indices = self.world.get_top_cells(min_x, max_x, min_z, max_z)
+        return self._compose_view(texture_manager, zs - min_z, xs - min_x, indices, 'top',
+                                  max_z - min_z + 1, max_x - min_x + 1, scale)
     
     def render_front_view(self, texture_manager: TextureManager, min_x: int, max_x: int, 
                           min_y: int, max_y: int, z: int, scale: int = 1) -> Image.Image:
         """渲染正视图"""
-        width = (max_x - min_x + 1) * texture_manager.texture_size
-        height = (max_y - min_y + 1) * texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.get_front_view_blocks(min_x, max_x, min_y, max_y, z)
-        
-        for x, y, block in visible_blocks:
-            pos_x = (x - min_x) * texture_manager.texture_size
-            pos_y = (max_y - y) * texture_manager.texture_size
-            
-            face = block.get_texture_face('front')
-            texture = texture_manager.get_texture(block.name, face)
-            
-            image.paste(texture, (pos_x, pos_y), texture)
-        
-        if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image
+        xs, ys, indices = self.world.get_front_cells(min_x, max_x, min_y, max_y)
+        return self._compose_view(texture_manager, max_y - ys, xs - min_x, indices, 'front',
+                                  max_y - min_y + 1, max_x - min_x + 1, scale)
     
     def render_side_view(self, texture_manager: TextureManager, min_z: int, max_z: int, 
                          min_y: int, max_y: int, x: int, scale: int = 1) -> Image.Image:
         """渲染侧视图"""
-        width = (max_z - min_z + 1) * texture_manager.texture_size
-        height = (max_y - min_y + 1) * texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.get_side_view_blocks(min_z, max_z, min_y, max_y, x)
-        
-        for z, y, block in visible_blocks:
-            pos_z = (z - min_z) * texture_manager.texture_size
-            pos_y = (max_y - y) * texture_manager.texture_size
-            
-            face = block.get_texture_face('side')
-            texture = texture_manager.get_texture(block.name, face)
+        zs, ys, indices = self.world.get_side_cells(min_z, max_z, min_y, max_y)
+        return self._compose_view(texture_manager, max_y - ys, zs - min_z, indices, 'side',
+                                  max_y - min_y + 1, max_z - min_z + 1, scale)
+    
+    def _compose_view(self, texture_manager: TextureManager, cell_rows: np.ndarray, cell_cols: np.ndarray,
+                      indices: np.ndarray, view: str, rows: int, cols: int, scale: int = 1) -> Image.Image:
+        """把可见方块的材质一次性拼接成视图图像
+        
+        每个格子最多只有一个可见方块，画布初始透明，逐块带遮罩paste的结果就是各格子材质
+        贴在透明底上的像素。这里按格子填入材质在图集中的行号，从图集一次取出整张画布，
+        不再逐块调用Image.paste；材质面只按可见的方块种类各查一次。
+        
+        Args:
+            texture_manager: 材质管理器
+            cell_rows: 可见方块在画布中的行号数组
+            cell_cols: 可见方块在画布中的列号数组
+            indices: 可见方块在world.blocks中的下标数组
+            view: 视图类型，用于选择方块的材质面
+            rows: 画布行数（方块数）
+            cols: 画布列数（方块数）
+            scale: 缩放比例
             
-            image.paste(texture, (pos_z, pos_y), texture)
+        Returns:
+            Image.Image: 渲染后的图像
+        """
+        size = texture_manager.texture_size
+        get_atlas_index = texture_manager.get_atlas_index
+        
+        # 相同(名称, 朝向)的方块材质面相同，只对可见的种类查询图集行号，再按种类展开到每个方块
+        kind_ids, kinds = self.world.get_block_kinds()
+        visible_kinds, kind_of_cell = np.unique(kind_ids[indices], return_inverse=True)
+        kind_rows = np.fromiter(
+            (get_atlas_index(kinds[kind].name, kinds[kind].get_texture_face(view)) for kind in visible_kinds.tolist()),
+            dtype=np.intp, count=len(visible_kinds))
+        
+        # 图集第0行为透明空格子，没有可见方块的格子保持0
+        grid = np.zeros((rows, cols), dtype=np.intp)
+        grid[cell_rows, cell_cols] = kind_rows[kind_of_cell.reshape(-1)]
+        atlas = texture_manager.get_atlas()
+        
+        # (rows, cols, size, size, 4) -> (rows * size, cols * size, 4)
+        canvas = atlas[grid].transpose(0, 2, 1, 3, 4).reshape(rows * size, cols * size, 4)
         
         if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image 
\ No newline at end of file
+            if isinstance(scale, int) and scale > 1:
+                # 整数倍放大时最近邻插值等价于重复像素
+                canvas = canvas.repeat(scale, axis=0).repeat(scale, axis=1)
+            else:
+                image = Image.fromarray(canvas)
+                return image.resize((int(cols * size * scale), int(rows * size * scale)), Image.Resampling.NEAREST)
+        
+        return Image.fromarray(canvas)
@@ -8,6 +8,62 @@ from .build_model import World, Block
 from .model_loader import ModelLoader
 from .model_renderer import ModelRenderer
 
+# 方块面图像缓存的键: (方块名称, 朝向)
+BlockFaceKey = Tuple[str, Optional[str]]
+
+
+def _get_block_face_image(block: Block, model_face: str, texture_view: str,
+                          texture_manager: TextureManager, model_renderer: Optional[ModelRenderer],
+                          model_loader: Optional[ModelLoader], use_block_models: bool,
+                          cache: Dict[BlockFaceKey, Tuple[Image.Image, bool]]) -> Tuple[Image.Image, bool]:
+    """
+    获取方块在某个视图中的图像，同名称同朝向的方块共用一次渲染结果
+    
+    方块图像只取决于方块名称（决定模型数据）和朝向，同一视图中按(名称, 朝向)缓存，
+    每种方块只复制一次模型数据并渲染一次模型面；模型数据也在此时才按需加载，
+    只有实际可见的方块种类才会读取模型文件；同时记录图像是否完全不透明
+    
+    Args:
+        block: 方块
+        model_face: 模型渲染使用的面名称(up/north/east)
+        texture_view: 传统纹理使用的视图名称(top/front/side)
+        texture_manager: 纹理管理器
+        model_renderer: 模型渲染器，为None时只使用传统纹理
+        model_loader: 模型加载器，方块尚未加载模型数据时使用
+        use_block_models: 是否使用方块模型渲染
+        cache: 当前视图的方块图像缓存
+        
+    Returns:
+        Tuple[Image.Image, bool]: 方块图像，以及图像是否完全不透明
+    """
+    key = (block.name, block.facing)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    
+    block_image: Optional[Image.Image] = None
+    
+    # 尝试使用模型渲染
+    if use_block_models and model_renderer:
+        if block.model_data is None and model_loader is not None:
+            block.model_data = model_loader.load_model(block.name)
+        if block.model_data:
+            # 在这里复制model_data，并添加facing属性
+            model_data = dict(block.model_data)
+            if block.facing:
+                model_data["facing"] = block.facing
+            block_image = model_renderer.render_model_face(model_data, model_face)
+    
+    # 如果模型渲染失败，使用传统纹理
+    if block_image is None:
+        face = block.get_texture_face(texture_view)
+        block_image = texture_manager.get_texture(block.name, face)
+    
+    cached = (block_image, TextureManager.is_opaque(block_image))
+    cache[key] = cached
+    return cached
+
+
 class BoundsCalculatorProcessor(AbstractRenderProcessor[Tuple[int, int, int, int, int, int]]):
     """计算结构边界的处理器"""
     
@@ -32,19 +88,8 @@ class BoundsCalculatorProcessor(AbstractRenderProcessor[Tuple[int, int, int, int
         if not world.blocks:
             return (0, 0, 0, 0, 0, 0)
         
-        min_x = min_y = min_z = float('inf')
-        max_x = max_y = max_z = float('-inf')
-        
-        for block in world.blocks:
-            x, y, z = block.position
-            min_x = min(min_x, x)
-            max_x = max(max_x, x)
-            min_y = min(min_y, y)
-            max_y = max(max_y, y)
-            min_z = min(min_z, z)
-            max_z = max(max_z, z)
-        
-        bounds = (int(min_x), int(max_x), int(min_y), int(max_y), int(min_z), int(max_z))
+        # 在坐标数组上一次求出三个轴的最小/最大值
+        bounds = world.get_bounds()
         context.set("bounds", bounds)
         return bounds
 
@@ -113,6 +158,7 @@ class TopViewProcessor(AbstractRenderProcessor[Image.Image]):
         scale = cast(int, context.get("scale", 1))
         use_block_models = cast(bool, context.get("use_block_models", True))
         model_renderer = context.get("model_renderer")
+        model_loader = context.get("model_loader")
         
         if not world or not texture_manager or not bounds:
             raise ValueError("上下文中缺少必要对象")
@@ -124,41 +170,31 @@ class TopViewProcessor(AbstractRenderProcessor[Image.Image]):
         height = (max_z - min_z + 1) * texture_manager.texture_size
         image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         
-        # 获取顶视图可见方块
-        visible_blocks: List[Tuple[int, int, Block]] = []
-        for block in world.blocks:
-            x, y, z = block.position
-            # 检查是否是顶层方块
-            is_top = True
-            for other_block in world.blocks:
-                ox, oy, oz = other_block.position
-                if ox == x and oz == z and oy > y:
-                    is_top = False
-                    break
-            if is_top:
-                visible_blocks.append((x, z, block))
-        
-        # 渲染方块
+        # 获取顶视图可见方块 - 使用预先计算的每列最高方块，不再两两比较所有方块
+        visible_blocks: List[Tuple[int, int, Block]] = world.get_top_blocks(min_x, max_x, min_z, max_z)
+        
+        # 循环内用到的尺寸和方法提前绑定为局部变量，坐标偏移预先乘好
+        size = texture_manager.texture_size
+        paste = image.paste
+        base_x = -min_x * size
+        base_z = -min_z * size
+        
+        # 渲染方块，同名称同朝向的方块共用图像，命中缓存时不再调用辅助函数
+        block_images: Dict[BlockFaceKey, Tuple[Image.Image, bool]] = {}
+        get_cached = block_images.get
         for x, z, block in visible_blocks:
-            pos_x = (x - min_x) * texture_manager.texture_size
-            pos_z = (z - min_z) * texture_manager.texture_size
-            
-            # 尝试使用模型渲染
-            block_image = None
-            if use_block_models and model_renderer and hasattr(block, "model_data") and block.model_data:
-                # 在这里复制model_data，并添加facing属性
-                model_data = dict(block.model_data)
-                if block.facing:
-                    model_data["facing"] = block.facing
-                block_image = model_renderer.render_model_face(model_data, "up")
+            cached = get_cached((block.name, block.facing))
+            if cached is None:
+                cached = _get_block_face_image(
+                    block, "up", "top", texture_manager, model_renderer, model_loader, use_block_models, block_images
+                )
+            block_image, opaque = cached
             
-            # 如果模型渲染失败，使用传统纹理
-            if block_image is None:
-                face = block.get_texture_face('top')
-                block_image = texture_manager.get_texture(block.name, face)
-            
-            # 贴到图像上
-            image.paste(block_image, (pos_x, pos_z), block_image)
+            # 贴到图像上，完全不透明的图像不需要遮罩，直接复制像素
+            if opaque:
+                paste(block_image, (x * size + base_x, z * size + base_z))
+            else:
+                paste(block_image, (x * size + base_x, z * size + base_z), block_image)
         
         # 缩放图像
         if scale != 1:
@@ -193,6 +229,7 @@ class FrontViewProcessor(AbstractRenderProcessor[Image.Image]):
         z_position = context.get("front_z")
         use_block_models = cast(bool, context.get("use_block_models", True))
         model_renderer = context.get("model_renderer")
+        model_loader = context.get("model_loader")
         
         if not world or not texture_manager or not bounds:
             raise ValueError("上下文中缺少必要对象")
@@ -208,35 +245,30 @@ class FrontViewProcessor(AbstractRenderProcessor[Image.Image]):
         height = (max_y - min_y + 1) * texture_manager.texture_size
         image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         
-        # 获取正视图可见方块
-        visible_blocks: List[Tuple[int, int, Block]] = []
-        for block in world.blocks:
-            x, y, z = block.position
-            # 检查是否是最前层方块
-            if z == z_position:
-                visible_blocks.append((x, y, block))
-            
-        # 渲染方块
-        for x, y, block in visible_blocks:
-            pos_x = (x - min_x) * texture_manager.texture_size
-            pos_y = (max_y - y) * texture_manager.texture_size - texture_manager.texture_size
-            
-            # 尝试使用模型渲染
-            block_image = None
-            if use_block_models and model_renderer and hasattr(block, "model_data") and block.model_data:
-                # 在这里复制model_data，并添加facing属性
-                model_data = dict(block.model_data)
-                if block.facing:
-                    model_data["facing"] = block.facing
-                block_image = model_renderer.render_model_face(model_data, "north")
+        # 循环内用到的尺寸和方法提前绑定为局部变量，坐标偏移预先乘好
+        size = texture_manager.texture_size
+        paste = image.paste
+        base_x = -min_x * size
+        base_y = (max_y - 1) * size
+        
+        # 渲染方块，同名称同朝向的方块共用图像，命中缓存时不再调用辅助函数
+        block_images: Dict[BlockFaceKey, Tuple[Image.Image, bool]] = {}
+        get_cached = block_images.get
+        # 只取z坐标等于正视平面的方块，在坐标数组上一次筛选
+        for block in world.get_slice_blocks(2, z_position):
+            x, y, _ = block.position
+            cached = get_cached((block.name, block.facing))
+            if cached is None:
+                cached = _get_block_face_image(
+                    block, "north", "front", texture_manager, model_renderer, model_loader, use_block_models, block_images
+                )
+            block_image, opaque = cached
             
-            # 如果模型渲染失败，使用传统纹理
-            if block_image is None:
-                face = block.get_texture_face('front')
-                block_image = texture_manager.get_texture(block.name, face)
-            
-            # 贴到图像上
-            image.paste(block_image, (pos_x, pos_y), block_image)
+            # 贴到图像上，完全不透明的图像不需要遮罩，直接复制像素
+            if opaque:
+                paste(block_image, (x * size + base_x, base_y - y * size))
+            else:
+                paste(block_image, (x * size + base_x, base_y - y * size), block_image)
         
         # 缩放图像
         if scale != 1:
@@ -271,6 +303,7 @@ class SideViewProcessor(AbstractRenderProcessor[Image.Image]):
         x_position = context.get("side_x")
         use_block_models = cast(bool, context.get("use_block_models", True))
         model_renderer = context.get("model_renderer")
+        model_loader = context.get("model_loader")
         
         if not world or not texture_manager or not bounds:
             raise ValueError("上下文中缺少必要对象")
@@ -286,35 +319,30 @@ class SideViewProcessor(AbstractRenderProcessor[Image.Image]):
         height = (max_y - min_y + 1) * texture_manager.texture_size
         image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         
-        # 获取侧视图可见方块
-        visible_blocks: List[Tuple[int, int, Block]] = []
-        for block in world.blocks:
-            x, y, z = block.position
-            # 检查是否是最侧面方块
-            if x == x_position:
-                visible_blocks.append((z, y, block))
-            
-        # 渲染方块
-        for z, y, block in visible_blocks:
-            pos_z = (z - min_z) * texture_manager.texture_size
-            pos_y = (max_y - y) * texture_manager.texture_size - texture_manager.texture_size
-            
-            # 尝试使用模型渲染
-            block_image = None
-            if use_block_models and model_renderer and hasattr(block, "model_data") and block.model_data:
-                # 在这里复制model_data，并添加facing属性
-                model_data = dict(block.model_data)
-                if block.facing:
-                    model_data["facing"] = block.facing
-                block_image = model_renderer.render_model_face(model_data, "east")
+        # 循环内用到的尺寸和方法提前绑定为局部变量，坐标偏移预先乘好
+        size = texture_manager.texture_size
+        paste = image.paste
+        base_z = -min_z * size
+        base_y = (max_y - 1) * size
+        
+        # 渲染方块，同名称同朝向的方块共用图像，命中缓存时不再调用辅助函数
+        block_images: Dict[BlockFaceKey, Tuple[Image.Image, bool]] = {}
+        get_cached = block_images.get
+        # 只取x坐标等于侧视平面的方块，在坐标数组上一次筛选
+        for block in world.get_slice_blocks(0, x_position):
+            _, y, z = block.position
+            cached = get_cached((block.name, block.facing))
+            if cached is None:
+                cached = _get_block_face_image(
+                    block, "east", "side", texture_manager, model_renderer, model_loader, use_block_models, block_images
+                )
+            block_image, opaque = cached
             
-            # 如果模型渲染失败，使用传统纹理
-            if block_image is None:
-                face = block.get_texture_face('side')
-                block_image = texture_manager.get_texture(block.name, face)
-            
-            # 贴到图像上
-            image.paste(block_image, (pos_z, pos_y), block_image)
+            # 贴到图像上，完全不透明的图像不需要遮罩，直接复制像素
+            if opaque:
+                paste(block_image, (z * size + base_z, base_y - y * size))
+            else:
+                paste(block_image, (z * size + base_z, base_y - y * size), block_image)
         
         # 缩放图像
         if scale != 1:
@@ -441,9 +469,5 @@ class ModelRendererProcessor(AbstractRenderProcessor[Any]):
         model_renderer = ModelRenderer(texture_manager)
         context.set("model_renderer", model_renderer)
         
-        # 为每个方块加载模型
-        for block in world.blocks:
-            if not hasattr(block, "model_data") or block.model_data is None:
-                block.model_data = model_loader.load_model(block.name)
-        
+        # 模型数据不再为所有方块预先加载，视图处理器渲染可见方块时按需加载
         return context 
\ No newline at end of file
@@ -33,28 +33,7 @@ class TopViewRenderer:
         Returns:
             Image.Image: 渲染后的图像
         """
-        width = (max_x - min_x + 1) * self.texture_manager.texture_size
-        height = (max_z - min_z + 1) * self.texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.projection.get_top_view_blocks(min_x, max_x, min_z, max_z)
-        
-        for x, z, block in visible_blocks:
-            pos_x = (x - min_x) * self.texture_manager.texture_size
-            pos_z = (z - min_z) * self.texture_manager.texture_size
-            
-            face = block.get_texture_face('top')
-            texture = self.texture_manager.get_texture(block.name, face)
-            
-            image.paste(texture, (pos_x, pos_z), texture)
-        
-        if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image
+        return self.projection.render_top_view(self.texture_manager, min_x, max_x, min_z, max_z, scale)
 
 
 class FrontViewRenderer:
@@ -84,28 +63,7 @@ class FrontViewRenderer:
         Returns:
             Image.Image: 渲染后的图像
         """
-        width = (max_x - min_x + 1) * self.texture_manager.texture_size
-        height = (max_y - min_y + 1) * self.texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.projection.get_front_view_blocks(min_x, max_x, min_y, max_y, z)
-        
-        for x, y, block in visible_blocks:
-            pos_x = (x - min_x) * self.texture_manager.texture_size
-            pos_y = (max_y - y) * self.texture_manager.texture_size
-            
-            face = block.get_texture_face('front')
-            texture = self.texture_manager.get_texture(block.name, face)
-            
-            image.paste(texture, (pos_x, pos_y), texture)
-        
-        if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image
+        return self.projection.render_front_view(self.texture_manager, min_x, max_x, min_y, max_y, z, scale)
 
 
 class SideViewRenderer:
@@ -135,28 +93,7 @@ class SideViewRenderer:
         Returns:
             Image.Image: 渲染后的图像
         """
-        width = (max_z - min_z + 1) * self.texture_manager.texture_size
-        height = (max_y - min_y + 1) * self.texture_manager.texture_size
-        
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        
-        visible_blocks = self.projection.get_side_view_blocks(min_z, max_z, min_y, max_y, x)
-        
-        for z, y, block in visible_blocks:
-            pos_z = (z - min_z) * self.texture_manager.texture_size
-            pos_y = (max_y - y) * self.texture_manager.texture_size
-            
-            face = block.get_texture_face('side')
-            texture = self.texture_manager.get_texture(block.name, face)
-            
-            image.paste(texture, (pos_z, pos_y), texture)
-        
-        if scale != 1:
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
-        
-        return image
+        return self.projection.render_side_view(self.texture_manager, min_z, max_z, min_y, max_y, x, scale)
 
 
 class ImageSaver(IImageSaver):
@@ -258,22 +195,7 @@ class StructureRenderer(IRenderer):
     
     def get_structure_bounds(self) -> BoundsType:
         """获取结构的边界坐标"""
-        if not self.world.blocks:
-            return (0, 0, 0, 0, 0, 0)
-        
-        min_x = min_y = min_z = float('inf')
-        max_x = max_y = max_z = float('-inf')
-        
-        for block in self.world.blocks:
-            x, y, z = block.position
-            min_x = min(min_x, x)
-            max_x = max(max_x, x)
-            min_y = min(min_y, y)
-            max_y = max(max_y, y)
-            min_z = min(min_z, z)
-            max_z = max(max_z, z)
-        
-        return (int(min_x), int(max_x), int(min_y), int(max_y), int(min_z), int(max_z))
+        return self.world.get_bounds()
     
     def save_image(self, image: Image.Image, output_path: str, format: str = 'PNG') -> bool:
         """保存图像到文件"""
@@ -1,10 +1,11 @@
 import os
-import json
 from PIL import Image
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple, Set, Union
 from astrbot import logger  # 添加logger导入
 
+from .config_loader import ConfigLoader
+
 class TextureManager:
     """材质管理器，负责加载、缓存和处理Minecraft方块材质"""
     
@@ -17,6 +18,10 @@ class TextureManager:
         self._setup_texture_paths(texture_path)
         self._setup_texture_size(texture_size)
         self.texture_cache: Dict[str, Image.Image] = {}
+        # 材质图集：第0行为透明空格子，其余每行是一种(方块名称, 材质面)贴在透明底上的像素
+        self.atlas_index: Dict[Tuple[str, str], int] = {}
+        self._atlas_tiles: List[np.ndarray] = []
+        self._atlas: Optional[np.ndarray] = None
         self.default_texture: Image.Image = self._create_default_texture()
         self.available_textures: Dict[str, str] = self._load_available_textures()
         logger.debug(f"纹理管理器初始化完成: 找到 {len(self.available_textures)} 个纹理")
@@ -63,29 +68,10 @@ class TextureManager:
         logger.debug(f"纹理尺寸设置为: {self.texture_size}x{self.texture_size}")
     
     def _load_resourcepack_config(self) -> Dict[str, Any]:
-        """加载资源包配置文件"""
-        config_path = os.path.join(self.resource_base_path, "resourcepack.json")
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    logger.debug(f"成功加载资源包配置: {config_path}")
-                    return config
-            logger.warning(f"资源包配置文件不存在: {config_path}，使用默认配置")
-            return self._get_default_resourcepack_config()
-        except Exception as e:
-            logger.error(f"加载资源包配置失败: {str(e)}，使用默认配置")
-            return self._get_default_resourcepack_config()
-    
-    def _get_default_resourcepack_config(self) -> Dict[str, Any]:
-        """返回默认的材质包配置"""
-        default_config = {
-            "selected_pack": "",
-            "available_packs": [],
-            "texture_size": {}
-        }
-        logger.debug(f"使用默认资源包配置: {default_config}")
-        return default_config
+        """加载资源包配置文件，与渲染引擎共用同一个ConfigLoader，文件未变化时不重复解析，缺失或损坏时由其记录日志"""
+        config = ConfigLoader.get_instance(self.resource_base_path).load_resourcepack_config()
+        logger.debug(f"资源包配置: {config}")
+        return config
     
     def _load_available_textures(self) -> Dict[str, str]:
         """加载可用的材质文件列表"""
@@ -132,6 +118,11 @@ class TextureManager:
             logger.error(f"调整纹理尺寸失败: {str(e)}, 原尺寸: {texture.size}, 目标尺寸: {target_size}")
             return self.default_texture
     
+    @staticmethod
+    def is_opaque(image: Image.Image) -> bool:
+        """判断RGBA图像是否完全不透明，不透明时paste可以不带遮罩，直接复制像素"""
+        return image.mode == 'RGBA' and image.getextrema()[3][0] == 255
+    
     def get_texture(self, block_name: str, face: str = "side") -> Image.Image:
         """获取指定方块和面的材质"""
         try:
@@ -155,6 +146,28 @@ class TextureManager:
             logger.error(f"获取纹理时出错: {str(e)}, block_name={block_name}, face={face}")
             return self.default_texture
     
+    def get_atlas_index(self, block_name: str, face: str = "side") -> int:
+        """获取方块材质面在图集中的行号，首次使用时把材质贴到透明底上加入图集，结果与Image.paste带遮罩一致"""
+        key = (block_name, face)
+        index = self.atlas_index.get(key)
+        if index is None:
+            if not self._atlas_tiles:
+                self._atlas_tiles.append(np.zeros((self.texture_size, self.texture_size, 4), dtype=np.uint8))
+            texture = self.get_texture(block_name, face)
+            canvas = Image.new('RGBA', texture.size, (0, 0, 0, 0))
+            canvas.paste(texture, (0, 0), texture)
+            index = self.atlas_index[key] = len(self._atlas_tiles)
+            self._atlas_tiles.append(np.asarray(canvas))
+        return index
+    
+    def get_atlas(self) -> np.ndarray:
+        """获取材质图集数组(N, size, size, 4)，只在加入新材质后重新拼接"""
+        if not self._atlas_tiles:
+            self._atlas_tiles.append(np.zeros((self.texture_size, self.texture_size, 4), dtype=np.uint8))
+        if self._atlas is None or len(self._atlas) != len(self._atlas_tiles):
+            self._atlas = np.stack(self._atlas_tiles)
+        return self._atlas
+    
     def _load_texture(self, block_name: str, face: str = "side") -> Optional[Image.Image]:
         """加载指定方块面的材质"""
         try:
@@ -211,4 +224,7 @@ class TextureManager:
     def clear_cache(self) -> None:
         """清除材质缓存"""
         self.texture_cache = {}
+        self.atlas_index = {}
+        self._atlas_tiles = []
+        self._atlas = None
         logger.debug("清除纹理缓存") 
\ No newline at end of file
@@ -1,6 +1,28 @@
 from litemapy import Schematic
 import collections
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+def analyze_material_file(file_path: str) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """
+    加载Litematic文件并统计方块、实体和方块实体数量
+    
+    材料分析进程池的子进程直接调用此函数，本模块只依赖litemapy，子进程不需要导入插件的其他模块。
+    只返回体积很小的统计结果，不返回Schematic，避免跨进程序列化大对象。
+    
+    Args:
+        file_path: Litematic文件路径
+        
+    Returns:
+        Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]: 方块统计、实体统计和方块实体统计
+    """
+    schematic = Schematic.load(file_path)
+    material_analyzer = Material("材料分析", 0)
+    
+    # 方块与方块实体在同一次遍历中统计，避免重复扫描全部方块位置
+    block_counts, tile_counts = material_analyzer.block_tile_collection(schematic)
+    entity_counts = material_analyzer.entity_collection(schematic)
+    
+    return block_counts, entity_counts, tile_counts
 
 class Material:
     def __init__(self, name: str, count: int) -> None:
@@ -17,7 +39,22 @@ class Material:
         Returns:
             Dict[str, int]: 包含每种方块ID及其数量的字典
         """
+        return self.block_tile_collection(schematic)[0]
+
+    def block_tile_collection(self, schematic: Schematic) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        一次遍历同时统计方块数量和方块实体数量
+        
+        只遍历一遍所有方块位置；block_collection和tile_collection也由此方法实现
+        
+        Args:
+            schematic: Litematic格式的示意图
+            
+        Returns:
+            Tuple[Dict[str, int], Dict[str, int]]: 方块统计和方块实体统计
+        """
         block_counts = collections.Counter()
+        tile_entity_counts = collections.Counter()
         
         # 遍历所有区域
         for region_name, region in schematic.regions.items():
@@ -29,10 +66,12 @@ class Material:
                 if block is None or block.id == "minecraft:air":
                     continue
                 
-                # 直接使用原始的block.id
                 block_counts[block.id] += 1
+                # 检查是否有NBT数据，这可能表明它是一个方块实体
+                if getattr(block, "nbt", None):
+                    tile_entity_counts[block.id] += 1
         
-        return dict(block_counts)
+        return dict(block_counts), dict(tile_entity_counts)
 
     def entity_collection(self, schematic: Schematic) -> Dict[str, int]:
         """
@@ -68,23 +107,6 @@ class Material:
         Returns:
             Dict[str, int]: 包含每种方块实体ID及其数量的字典
         """
-        tile_entity_counts = collections.Counter()
-        
-        # 遍历所有区域
-        for region_name, region in schematic.regions.items():
-            # 遍历区域中的每个方块位置
-            for x, y, z in region.block_positions():
-                block = region[x, y, z]
-                
-                # 跳过空气方块
-                if block is None or block.id == "minecraft:air":
-                    continue
-                
-                # 检查是否有NBT数据，这可能表明它是一个方块实体
-                if hasattr(block, "nbt") and block.nbt:
-                    # 直接使用原始的block.id
-                    tile_entity_counts[block.id] += 1
-        
-        return dict(tile_entity_counts)
+        return self.block_tile_collection(schematic)[1]
         
 
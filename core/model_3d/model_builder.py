@@ -38,11 +38,24 @@ class ModelBuilder:
             
             # 遍历每个区域
             for region_name, region in schematic.regions.items():
+                # 相同状态的方块共用调色板中的同一个BlockState对象，按对象缓存方块ID和属性，
+                # 每种状态只解析一次，同状态的方块共享同一个只读属性字典；缓存同时持有对象引用，避免id被复用
+                state_cache: Dict[int, Tuple[Any, Optional[Tuple[str, Dict[str, Any]]]]] = {}
                 for x, y, z in region.block_positions():
                     block = region[x, y, z]
                     
-                    # 跳过空气方块
-                    if block is None or block.id == "minecraft:air":
+                    cached = state_cache.get(id(block))
+                    if cached is None:
+                        # 空气方块记为None，之后直接跳过
+                        if block is None or block.id == "minecraft:air":
+                            info = None
+                        else:
+                            info = (block.id, self._get_block_properties(block))
+                        cached = (block, info)
+                        state_cache[id(block)] = cached
+                    
+                    info = cached[1]
+                    if info is None:
                         continue
                     
                     # 更新边界
@@ -53,16 +66,10 @@ class ModelBuilder:
                     self.min_z = min(self.min_z, z)
                     self.max_z = max(self.max_z, z)
                     
-                    # 获取方块属性
-                    properties = {}
-                    if hasattr(block, '_BlockState__properties'):
-                        for prop in block._BlockState__properties:
-                            properties[prop] = block[prop]
-                    
                     # 存储方块数据
                     self.blocks[(x, y, z)] = {
-                        'id': block.id,
-                        'properties': properties,
+                        'id': info[0],
+                        'properties': info[1],
                         'position': (x, y, z)
                     }
             
@@ -71,6 +78,19 @@ class ModelBuilder:
             print(f"构建模型时出错: {e}")
             return False
     
+    def _get_block_properties(self, block: Any) -> Dict[str, Any]:
+        """
+        获取方块状态的属性字典
+        
+        Args:
+            block: litemapy的BlockState对象
+            
+        Returns:
+            Dict[str, Any]: 属性名到属性值的映射，没有属性时为空字典
+        """
+        properties = getattr(block, '_BlockState__properties', None)
+        return dict(properties) if properties else {}
+    
     def get_model_data(self) -> Dict[str, Any]:
         """
         获取构建的模型数据
@@ -2,13 +2,19 @@ import os
 import json
 from typing import Dict, Any, Optional
 
+# orjson为可选依赖，解析模型JSON更快，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ModelResolver:
     """加载并解析方块模型文件，支持继承合并"""
 
     def __init__(self, resource_dir: str) -> None:
         self.models_dir = os.path.join(resource_dir, "models", "block")
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
 
     def load(self, model_name: str) -> Optional[Dict[str, Any]]:
         """按模型名加载模型数据
@@ -20,15 +26,12 @@ class ModelResolver:
         if normalized in self._cache:
             return self._cache[normalized]
 
-        model_path = os.path.join(self.models_dir, f"{normalized}.json")
-        if not os.path.exists(model_path):
-            return None
-
-        model_data = self._load_model_file(model_path)
-        if not model_data:
-            return None
-
-        model_data = self._resolve_inheritance(model_data)
+        # 不存在或加载失败的模型缓存为None，同一模型不再重复打开文件
+        model_data = self._load_model_file(os.path.join(self.models_dir, f"{normalized}.json"))
+        if model_data:
+            model_data = self._resolve_inheritance(model_data)
+        else:
+            model_data = None
         self._cache[normalized] = model_data
         return model_data
 
@@ -40,9 +43,11 @@ class ModelResolver:
         return model_name
 
     def _load_model_file(self, path: str) -> Optional[Dict[str, Any]]:
+        # 直接打开文件，不存在时抛出异常返回None，不再单独exists检查
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             return None
 
@@ -51,11 +56,7 @@ class ModelResolver:
             return model_data
 
         parent_name = self._normalize_model_name(model_data["parent"])
-        parent_path = os.path.join(self.models_dir, f"{parent_name}.json")
-        if not os.path.exists(parent_path):
-            return model_data
-
-        parent_data = self._load_model_file(parent_path)
+        parent_data = self._load_model_file(os.path.join(self.models_dir, f"{parent_name}.json"))
         if not parent_data:
             return model_data
 
@@ -63,10 +64,11 @@ class ModelResolver:
         return self._merge_model_data(parent_data, model_data)
 
     def _merge_model_data(self, parent: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
-        merged = parent.copy()
-        for key, value in child.items():
-            if key == "textures" and "textures" in merged:
-                merged["textures"].update(value)
-            elif key == "elements" or key not in merged:
-                merged[key] = value
+        # 父模型已有的属性保留，子模型只补充新属性；元素使用子模型的
+        merged = {**child, **parent}
+        if "elements" in child:
+            merged["elements"] = child["elements"]
+        # 纹理新建字典合并，不修改父模型的textures
+        if "textures" in child and "textures" in parent:
+            merged["textures"] = {**parent["textures"], **child["textures"]}
         return merged
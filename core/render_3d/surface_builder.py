@@ -1,5 +1,5 @@
 import math
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .model_resolver import ModelResolver
 from .texture_sampler import TextureSampler
@@ -37,6 +37,15 @@ class SurfaceBuilder:
         "bottom": 0.7,
     }
 
+    # 需要特殊模型的方块名到类别的映射，名称以glass_pane结尾的方块另外判断
+    SPECIAL_MODEL_KINDS = {
+        "redstone_wire": "redstone",
+        "hopper": "hopper",
+        "piston": "piston",
+        "sticky_piston": "piston",
+        "piston_head": "piston",
+    }
+
     def __init__(self, model_data: Dict[str, Any], resource_dir: str,
                  native_textures: bool = False) -> None:
         self.model_data = model_data
@@ -45,6 +54,8 @@ class SurfaceBuilder:
         self.model_resolver = ModelResolver(resource_dir)
 
         self._cube_face_cache: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+        # 方块ID到(特殊模型类别, 去掉命名空间的名称)的缓存，每种方块只判断一次
+        self._special_kind_cache: Dict[str, Tuple[Optional[str], str]] = {}
 
     def build_surfaces(self) -> List[Dict[str, Any]]:
         surfaces: List[Dict[str, Any]] = []
@@ -76,21 +87,30 @@ class SurfaceBuilder:
         return surfaces
 
     def _get_special_models(self, block_id: str, properties: Dict[str, Any]) -> List[Dict[str, Any]]:
-        name = block_id.split(":")[-1]
+        cached = self._special_kind_cache.get(block_id)
+        if cached is None:
+            name = block_id.split(":")[-1]
+            kind = self.SPECIAL_MODEL_KINDS.get(name)
+            if kind is None and name.endswith("glass_pane"):
+                kind = "glass_pane"
+            cached = (kind, name)
+            self._special_kind_cache[block_id] = cached
+
+        kind, name = cached
+        # 绝大多数方块是普通方块，一次字典查找后直接返回
+        if kind is None:
+            return []
 
-        if name == "redstone_wire":
+        if kind == "redstone":
             return self._get_redstone_models(properties)
 
-        if name == "hopper":
+        if kind == "hopper":
             return self._get_hopper_models(properties)
 
-        if name in ("piston", "sticky_piston", "piston_head"):
+        if kind == "piston":
             return self._get_piston_models(block_id, properties)
 
-        if name.endswith("glass_pane"):
-            return self._get_glass_pane_models(name, properties)
-
-        return []
+        return self._get_glass_pane_models(name, properties)
 
     def _get_redstone_models(self, properties: Dict[str, Any]) -> List[Dict[str, Any]]:
         connections = {
@@ -41,8 +41,11 @@ class LitematicPlugin(Star):
         self.render_3d_manager: Render3DManager = Render3DManager(self.config)
         self.lang_manager: LangManager = LangManager(plugin_dir)
         
+        # 插件线程池，用于上传文件等IO操作，避免占满默认线程池
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.config.get_config_value("max_workers", 3))
+        
         # 初始化命令处理器
-        self.upload_command: UploadCommand = UploadCommand(self.file_manager, self.category_manager)
+        self.upload_command: UploadCommand = UploadCommand(self.file_manager, self.category_manager, self.executor)
         self.list_command: ListCommand = ListCommand(self.category_manager, self.file_manager)
         self.delete_command: DeleteCommand = DeleteCommand(self.category_manager, self.file_manager)
         self.get_command: GetCommand = GetCommand(self.file_manager)
@@ -58,9 +61,6 @@ class LitematicPlugin(Star):
         os.makedirs(os.path.join(plugin_dir, "temp"), exist_ok=True)
         
         self.litematic_categories: List[str] = self.category_manager.get_categories()
-        
-        # 保留原有的线程池
-        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.config.get_config_value("max_workers", 3))
     
     def load_categories(self) -> None:
         """保留兼容性，实际调用CategoryManager"""
@@ -69,6 +69,11 @@ class LitematicPlugin(Star):
     def save_categories(self) -> None:
         """保留兼容性，实际调用CategoryManager"""
         self.category_manager.save_categories()
+
+    async def terminate(self) -> None:
+        """插件卸载时释放线程池和进程池"""
+        self.material_command.shutdown()
+        self.executor.shutdown(wait=False)
     
     @filter.command("投影",alias=["litematic"])
     async def litematic(self, event: AstrMessageEvent, category: str = "default") -> AsyncGenerator[MessageChain, None]:
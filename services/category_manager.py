@@ -1,7 +1,7 @@
 import os
 import json
 import asyncio
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from astrbot import logger
 from ..utils.config import Config
 from ..utils.exceptions import (
@@ -25,6 +25,12 @@ class CategoryManager:
         self.config: Config = config
         self.categories_file: str = config.get_categories_file()
         self.categories: List[str] = []
+        # 分类名只读集合索引，分类列表变更后整体重建，存在性检查为O(1)哈希查找
+        self._category_set: FrozenSet[str] = frozenset()
+        # 以逗号拼接好的分类列表文本，用于"分类不存在"等提示，随索引一起重建
+        self._categories_joined: str = ""
+        # 每行一个"- 分类名"的分类列表文本，用于列表和帮助信息
+        self._categories_bulleted: str = ""
         self.load_categories()
     
     def load_categories(self) -> None:
@@ -65,6 +71,14 @@ class CategoryManager:
             # 回退到默认分类但仍记录错误
             self.categories = self.config.get_config_value("default_categories", ["建筑", "红石"])
             # 不抛出异常，因为这是初始化过程，需要保证能够正常启动
+        finally:
+            self._rebuild_index()
+    
+    def _rebuild_index(self) -> None:
+        """根据分类列表重建分类名集合索引（内部方法），分类列表发生变化时调用"""
+        self._category_set = frozenset(self.categories)
+        self._categories_joined = ", ".join(self.categories)
+        self._categories_bulleted = "- " + "\n- ".join(self.categories) if self.categories else ""
     
     def save_categories(self) -> None:
         """保存分类列表到JSON文件
@@ -117,6 +131,22 @@ class CategoryManager:
         """
         return self.categories  # 直接返回内存中的分类列表，不需要IO操作
     
+    def get_categories_joined(self) -> str:
+        """获取以逗号拼接的分类列表文本
+        
+        Returns:
+            str: 分类列表文本
+        """
+        return self._categories_joined
+    
+    def get_categories_bulleted(self) -> str:
+        """获取每行一个分类的列表文本（"- 分类名"）
+        
+        Returns:
+            str: 分类列表文本，没有分类时为空字符串
+        """
+        return self._categories_bulleted
+    
     def category_exists(self, category: str) -> bool:
         """检查分类是否存在
         
@@ -126,7 +156,7 @@ class CategoryManager:
         Returns:
             bool: 是否存在
         """
-        return category in self.categories
+        return category in self._category_set
     
     async def category_exists_async(self, category: str) -> bool:
         """异步检查分类是否存在
@@ -139,7 +169,7 @@ class CategoryManager:
         Returns:
             bool: 是否存在
         """
-        return category in self.categories  # 直接检查内存中的分类列表，不需要IO操作
+        return category in self._category_set  # 直接检查内存中的集合索引，不需要IO操作
     
     def create_category(self, category: str) -> None:
         """创建新的分类
@@ -165,6 +195,9 @@ class CategoryManager:
             CategoryAlreadyExistsError: 分类已存在
             CategoryCreateError: 创建分类失败
         """
+        # 分类已存在时直接用内存索引判断，不必切换到线程池
+        if category in self._category_set:
+            raise CategoryAlreadyExistsError(category)
         await asyncio.to_thread(self._sync_create_category, category)
     
     def _sync_create_category(self, category: str) -> None:
@@ -177,11 +210,12 @@ class CategoryManager:
             CategoryAlreadyExistsError: 分类已存在
             CategoryCreateError: 创建分类失败
         """
-        if category in self.categories:
+        if category in self._category_set:
             raise CategoryAlreadyExistsError(category)
             
         try:
             self.categories.append(category)
+            self._rebuild_index()
             self.save_categories()
             # 创建分类目录
             category_dir = os.path.join(self.config.get_litematic_dir(), category)
@@ -191,8 +225,9 @@ class CategoryManager:
             error_msg = f"创建分类 {category} 失败: {e}"
             logger.error(error_msg)
             # 回滚内存中的分类列表
-            if category in self.categories:
+            if category in self._category_set:
                 self.categories.remove(category)
+                self._rebuild_index()
             raise CategoryCreateError(category, str(e))
     
     def delete_category(self, category: str) -> None:
@@ -219,6 +254,9 @@ class CategoryManager:
             CategoryNotFoundError: 分类不存在
             CategoryDeleteError: 删除分类失败
         """
+        # 分类不存在时直接用内存索引判断，不必切换到线程池
+        if category not in self._category_set:
+            raise CategoryNotFoundError(category)
         await asyncio.to_thread(self._sync_delete_category, category)
     
     def _sync_delete_category(self, category: str) -> None:
@@ -231,11 +269,12 @@ class CategoryManager:
             CategoryNotFoundError: 分类不存在
             CategoryDeleteError: 删除分类失败
         """
-        if category not in self.categories:
+        if category not in self._category_set:
             raise CategoryNotFoundError(category)
             
         try:
             self.categories.remove(category)
+            self._rebuild_index()
             self.save_categories()
         except Exception as e:
             error_msg = f"删除分类 {category} 失败: {e}"
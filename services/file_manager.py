@@ -1,13 +1,18 @@
 import os
 import shutil
 import asyncio
-from typing import List, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 from astrbot import logger
 from ..utils.config import Config
 from .category_manager import CategoryManager
-from ..utils.exceptions import FileNotFoundError, FileDeleteError, MultipleFilesFoundError, CategoryNotFoundError, CategoryDeleteError, FileSaveError
+from ..utils.exceptions import FileNotFoundError, FileDeleteError, MultipleFilesFoundError, CategoryNotFoundError, CategoryDeleteError, FileSaveError, LitematicPluginError
 from ..utils.logging_utils import log_error, log_operation
 
+# 文件名解析结果缓存的最大条目数
+RESOLVE_CACHE_SIZE = 256
+
 class FileManager:
     """文件管理器，负责litematic文件的管理"""
     
@@ -21,6 +26,13 @@ class FileManager:
         self.config: Config = config
         self.category_manager: Optional[CategoryManager] = category_manager
         self.litematic_dir: str = config.get_litematic_dir()
+        # 分类文件名索引: 分类 -> (目录mtime, {文件名: casefold后的文件名})，上传/删除时失效
+        self._lower_index: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        # 文件名解析结果缓存: (分类, 请求的文件名) -> (解析时使用的索引, 真实文件名)，
+        # 索引重建后旧条目自然失效，按LRU淘汰
+        self._resolve_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, str], str]]" = OrderedDict()
+        # 解析缓存会在多个to_thread工作线程中读写，查找、调整顺序和淘汰需要在锁内完成
+        self._resolve_lock = threading.Lock()
         os.makedirs(self.litematic_dir, exist_ok=True)
     
     def get_litematic_dir(self) -> str:
@@ -83,21 +95,56 @@ class FileManager:
             MultipleFilesFoundError: 找到多个匹配的文件
         """
         category_dir = os.path.join(self.litematic_dir, category)
+        entries = self._sync_get_name_index(category)
+        
+        # 同一索引下重复解析同一文件名时直接复用结果，跳过模糊匹配
+        key = (category, filename)
+        with self._resolve_lock:
+            cached = self._resolve_cache.get(key)
+            if cached is not None and cached[0] is entries:
+                self._resolve_cache.move_to_end(key)
+                return os.path.join(category_dir, cached[1])
+        
+        # 模糊匹配在锁外进行，不阻塞其他线程的缓存命中
+        name = self._match_filename(category, entries, filename)
+        with self._resolve_lock:
+            self._resolve_cache[key] = (entries, name)
+            self._resolve_cache.move_to_end(key)
+            if len(self._resolve_cache) > RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+        return os.path.join(category_dir, name)
+    
+    def _match_filename(self, category: str, entries: Dict[str, str], filename: str) -> str:
+        """在文件名索引中匹配文件，支持模糊匹配（内部方法）
         
-        if not os.path.exists(category_dir):
-            raise CategoryNotFoundError(category)
+        Args:
+            category: 分类名
+            entries: 文件名到casefold后文件名的映射
+            filename: 文件名
             
-        # 精确匹配
-        file_path = os.path.join(category_dir, filename)
-        if os.path.exists(file_path):
-            return file_path
+        Returns:
+            str: 匹配到的真实文件名
             
-        # 模糊匹配
-        matches = [f for f in os.listdir(category_dir) 
-                  if f.endswith('.litematic') and filename.lower() in f.lower()]
+        Raises:
+            FileNotFoundError: 文件不存在
+            MultipleFilesFoundError: 找到多个匹配的文件
+        """
+        # 精确匹配
+        if filename in entries:
+            return filename
+
+        # 模糊匹配 - 直接使用索引中预先casefold的文件名，单次遍历；
+        # 忽略大小写完全一致时立即返回，不再视为多个匹配
+        needle = filename.casefold()
+        matches: List[str] = []
+        for name, folded in entries.items():
+            if needle in folded:
+                if folded == needle:
+                    return name
+                matches.append(name)
         
         if len(matches) == 1:
-            return os.path.join(category_dir, matches[0])
+            return matches[0]
         elif len(matches) > 1:
             # 多个匹配时不再自动选择第一个，而是抛出异常
             logger.warning(f"文件名'{filename}'在'{category}'中有多个匹配: {matches}")
@@ -106,6 +153,48 @@ class FileManager:
         # 没有找到匹配的文件
         raise FileNotFoundError(category, filename)
     
+    def _sync_get_name_index(self, category: str) -> Dict[str, str]:
+        """获取分类下litematic文件名索引（内部方法）
+        
+        索引按目录mtime校验，目录未变化时直接复用，避免重复扫描和逐个文件名转小写。
+        
+        Args:
+            category: 分类名
+            
+        Returns:
+            Dict[str, str]: 文件名到casefold后文件名的映射
+            
+        Raises:
+            CategoryNotFoundError: 分类不存在
+        """
+        category_dir = os.path.join(self.litematic_dir, category)
+
+        # 注意：此模块的FileNotFoundError是插件异常，这里需捕获内置的OSError
+        try:
+            mtime_ns = os.stat(category_dir).st_mtime_ns
+            cached = self._lower_index.get(category)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+            # 单次扫描目录，目录无法访问即视为分类不存在，省去逐个文件的stat调用
+            with os.scandir(category_dir) as it:
+                entries = {e.name: e.name.casefold() for e in it
+                           if e.name.endswith('.litematic') and e.is_file(follow_symlinks=False)}
+        except OSError:
+            self._invalidate_name_index(category)
+            raise CategoryNotFoundError(category)
+
+        self._lower_index[category] = (mtime_ns, entries)
+        return entries
+    
+    def _invalidate_name_index(self, category: str) -> None:
+        """使指定分类的文件名索引失效（内部方法）
+        
+        Args:
+            category: 分类名
+        """
+        self._lower_index.pop(category, None)
+    
     def save_litematic_file(self, source_path: str, category: str, filename: str) -> str:
         """保存litematic文件到指定分类目录
         
@@ -160,6 +249,7 @@ class FileManager:
             
             target_path = os.path.join(category_dir, os.path.basename(filename))
             shutil.copy2(source_path, target_path)
+            self._invalidate_name_index(category)
             return target_path
         except Exception as e:
             error = FileSaveError(filename, str(e))
@@ -177,6 +267,7 @@ class FileManager:
             str: 删除的文件名
             
         Raises:
+            CategoryNotFoundError: 分类不存在
             FileNotFoundError: 文件不存在
             MultipleFilesFoundError: 找到多个匹配的文件
             FileDeleteError: 删除文件失败
@@ -196,6 +287,7 @@ class FileManager:
             str: 删除的文件名
             
         Raises:
+            CategoryNotFoundError: 分类不存在
             FileNotFoundError: 文件不存在
             MultipleFilesFoundError: 找到多个匹配的文件
             FileDeleteError: 删除文件失败
@@ -213,33 +305,90 @@ class FileManager:
             str: 删除的文件名
             
         Raises:
+            CategoryNotFoundError: 分类不存在
             FileNotFoundError: 文件不存在
             MultipleFilesFoundError: 找到多个匹配的文件
             FileDeleteError: 删除文件失败
         """
+        result = self._sync_delete_litematic_files_bulk(category, [filename])[0]
+        if isinstance(result, LitematicPluginError):
+            raise result
+        return result
+    
+    def delete_litematic_files_bulk(self, category: str, filenames: List[str]) -> List[Union[str, LitematicPluginError]]:
+        """批量删除指定分类下的多个litematic文件
+        
+        Args:
+            category: 分类名
+            filenames: 文件名列表
+            
+        Returns:
+            List[Union[str, LitematicPluginError]]: 与filenames一一对应的结果，成功为删除的文件名，失败为对应异常
+            
+        Raises:
+            CategoryNotFoundError: 分类不存在
+        """
+        return self._sync_delete_litematic_files_bulk(category, filenames)
+    
+    async def delete_litematic_files_bulk_async(self, category: str, filenames: List[str]) -> List[Union[str, LitematicPluginError]]:
+        """异步批量删除指定分类下的多个litematic文件
+        
+        此方法是异步的，调用时需要使用await。
+        
+        Args:
+            category: 分类名
+            filenames: 文件名列表
+            
+        Returns:
+            List[Union[str, LitematicPluginError]]: 与filenames一一对应的结果，成功为删除的文件名，失败为对应异常
+            
+        Raises:
+            CategoryNotFoundError: 分类不存在
+        """
+        return await asyncio.to_thread(self._sync_delete_litematic_files_bulk, category, filenames)
+    
+    def _sync_delete_litematic_files_bulk(self, category: str, filenames: List[str]) -> List[Union[str, LitematicPluginError]]:
+        """同步批量删除指定分类下的多个litematic文件（内部方法）
+        
+        整批只扫描一次目录，之后逐个匹配并删除；已删除的文件会从本批次的匹配范围中移除。
+        
+        Args:
+            category: 分类名
+            filenames: 文件名列表
+            
+        Returns:
+            List[Union[str, LitematicPluginError]]: 与filenames一一对应的结果，成功为删除的文件名，失败为对应异常
+            
+        Raises:
+            CategoryNotFoundError: 分类不存在
+        """
         category_dir = self._get_category_dir(category)
-        file_path = os.path.join(category_dir, filename)
-        
-        if not os.path.exists(file_path):
-            # 尝试模糊匹配
-            matches = self._sync_find_files_by_pattern(category, filename)
-            if not matches:
-                raise FileNotFoundError(category, filename)
-            elif len(matches) == 1:
-                file_path = os.path.join(category_dir, matches[0])
-            else:
-                raise MultipleFilesFoundError(category, filename, matches)
+        entries = dict(self._sync_get_name_index(category))
+        results: List[Union[str, LitematicPluginError]] = []
         
         try:
-            os.remove(file_path)
-            deleted_filename = os.path.basename(file_path)
-            log_operation("删除文件", True, {"category": category, "file_name": deleted_filename})
-            return deleted_filename
-        except Exception as e:
-            error_msg = f"删除文件失败: {e}"
-            error = FileDeleteError(category, os.path.basename(file_path), str(e))
-            log_error(error)
-            raise error
+            for filename in filenames:
+                try:
+                    name = self._match_filename(category, entries, filename)
+                except (FileNotFoundError, MultipleFilesFoundError) as e:
+                    results.append(e)
+                    continue
+                
+                try:
+                    os.remove(os.path.join(category_dir, name))
+                except Exception as e:
+                    error = FileDeleteError(category, name, str(e))
+                    log_error(error)
+                    results.append(error)
+                    continue
+                
+                del entries[name]
+                log_operation("删除文件", True, {"category": category, "file_name": name})
+                results.append(name)
+        finally:
+            self._invalidate_name_index(category)
+        
+        return results
     
     def delete_category(self, category: str) -> None:
         """删除整个分类及其文件
@@ -284,12 +433,69 @@ class FileManager:
             
         try:
             shutil.rmtree(category_dir)
+            self._invalidate_name_index(category)
             log_operation("删除分类", True, {"category": category})
         except Exception as e:
             error = CategoryDeleteError(category, str(e))
             log_error(error)
             raise error
-    
+
+    def delete_category_bulk(self, category: str) -> None:
+        """一次性删除整个分类目录及分类记录
+
+        Args:
+            category: 分类名
+
+        Raises:
+            CategoryNotFoundError: 分类不存在
+            CategoryDeleteError: 删除分类失败
+        """
+        self._sync_delete_category_bulk(category)
+
+    async def delete_category_bulk_async(self, category: str) -> None:
+        """异步一次性删除整个分类目录及分类记录
+
+        此方法是异步的，调用时需要使用await。
+
+        Args:
+            category: 分类名
+
+        Raises:
+            CategoryNotFoundError: 分类不存在
+            CategoryDeleteError: 删除分类失败
+        """
+        await asyncio.to_thread(self._sync_delete_category_bulk, category)
+
+    def _sync_delete_category_bulk(self, category: str) -> None:
+        """同步一次性删除整个分类目录及分类记录（内部方法）
+
+        目录删除与分类记录删除在同一次线程调度中完成；
+        分类目录从未创建（例如尚未上传文件的默认分类）时仅删除分类记录。
+
+        Args:
+            category: 分类名
+
+        Raises:
+            CategoryNotFoundError: 分类不存在
+            CategoryDeleteError: 删除分类失败
+        """
+        category_dir = self._get_category_dir(category)
+
+        # 直接删除，不预先stat；目录不存在时由rmtree抛出内置异常（OSError子类）
+        try:
+            shutil.rmtree(category_dir)
+        except OSError as e:
+            if os.path.lexists(category_dir):
+                error = CategoryDeleteError(category, str(e))
+                log_error(error)
+                raise error
+        finally:
+            self._invalidate_name_index(category)
+
+        if self.category_manager is not None:
+            self.category_manager.delete_category(category)
+        log_operation("删除分类", True, {"category": category})
+
     def find_files_by_pattern(self, category: str, pattern: str) -> List[str]:
         """在指定分类下查找匹配模式的文件
         
@@ -335,12 +541,9 @@ class FileManager:
         Raises:
             CategoryNotFoundError: 分类不存在
         """
-        category_dir = self._get_category_dir(category)
-        if not os.path.exists(category_dir):
-            raise CategoryNotFoundError(category)
-            
-        return [f for f in os.listdir(category_dir) 
-                if f.endswith('.litematic') and pattern.lower() in f.lower()]
+        needle = pattern.casefold()
+        return [name for name, folded in self._sync_get_name_index(category).items()
+                if needle in folded]
     
     def list_files(self, category: str) -> List[str]:
         """列出指定分类下的所有litematic文件
@@ -384,11 +587,7 @@ class FileManager:
         Raises:
             CategoryNotFoundError: 分类不存在
         """
-        category_dir = self._get_category_dir(category)
-        if not os.path.exists(category_dir):
-            raise CategoryNotFoundError(category)
-            
-        return [f for f in os.listdir(category_dir) if f.endswith('.litematic')]
+        return list(self._sync_get_name_index(category))
     
     def _get_category_dir(self, category: str) -> str:
         """获取分类目录路径
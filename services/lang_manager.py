@@ -1,6 +1,6 @@
 import os
 import json
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from astrbot import logger
 
 
@@ -18,10 +18,13 @@ class LangManager:
         self.plugin_dir: str = plugin_dir
         self.lang_code: str = lang_code
         self.translations: Dict[str, str] = {}
+        # 翻译结果缓存，键为(类型, 原始ID)，避免每次重复去前缀和拼接翻译键
+        self._id_cache: Dict[Tuple[str, str], str] = {}
         self._load_translations()
     
     def _load_translations(self) -> None:
         """加载语言翻译文件"""
+        self._id_cache.clear()
         try:
             lang_file_path = os.path.join(self.plugin_dir, "lang", f"{self.lang_code}.json")
             
@@ -48,23 +51,7 @@ class LangManager:
         Returns:
             翻译后的中文名称，如果找不到翻译则返回原ID
         """
-        if not block_id:
-            return block_id
-        
-        # 移除 minecraft: 前缀
-        if block_id.startswith("minecraft:"):
-            block_key = block_id[10:]  # 移除 "minecraft:" 前缀
-        else:
-            block_key = block_id
-        
-        # 尝试查找翻译
-        translation_key = f"block.minecraft.{block_key}"
-        
-        if translation_key in self.translations:
-            return self.translations[translation_key]
-        
-        # 如果没有找到翻译，返回原ID
-        return block_id
+        return self._translate_id("block", block_id)
     
     def translate_item(self, item_id: str) -> str:
         """
@@ -76,23 +63,7 @@ class LangManager:
         Returns:
             翻译后的中文名称，如果找不到翻译则返回原ID
         """
-        if not item_id:
-            return item_id
-        
-        # 移除 minecraft: 前缀
-        if item_id.startswith("minecraft:"):
-            item_key = item_id[10:]
-        else:
-            item_key = item_id
-        
-        # 尝试查找翻译
-        translation_key = f"item.minecraft.{item_key}"
-        
-        if translation_key in self.translations:
-            return self.translations[translation_key]
-        
-        # 如果没有找到翻译，返回原ID
-        return item_id
+        return self._translate_id("item", item_id)
     
     def translate_entity(self, entity_id: str) -> str:
         """
@@ -104,23 +75,30 @@ class LangManager:
         Returns:
             翻译后的中文名称，如果找不到翻译则返回原ID
         """
-        if not entity_id:
-            return entity_id
-        
-        # 移除 minecraft: 前缀
-        if entity_id.startswith("minecraft:"):
-            entity_key = entity_id[10:]
-        else:
-            entity_key = entity_id
-        
-        # 尝试查找翻译
-        translation_key = f"entity.minecraft.{entity_key}"
-        
-        if translation_key in self.translations:
-            return self.translations[translation_key]
+        return self._translate_id("entity", entity_id)
+    
+    def _translate_id(self, kind: str, resource_id: str) -> str:
+        """
+        按类型翻译带命名空间的ID，结果会被缓存
         
-        # 如果没有找到翻译，返回原ID
-        return entity_id
+        Args:
+            kind: 翻译类型，如 "block"、"item"、"entity"
+            resource_id: 原始ID，格式如 "minecraft:stone"
+            
+        Returns:
+            翻译后的中文名称，如果找不到翻译则返回原ID
+        """
+        if not resource_id:
+            return resource_id
+        
+        cache_key = (kind, resource_id)
+        translated = self._id_cache.get(cache_key)
+        if translated is None:
+            # 移除 minecraft: 前缀后查找翻译，找不到时返回原ID
+            name = resource_id.removeprefix("minecraft:")
+            translated = self.translations.get(f"{kind}.minecraft.{name}", resource_id)
+            self._id_cache[cache_key] = translated
+        return translated
     
     def translate(self, key: str) -> str:
         """
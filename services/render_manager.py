@@ -1,14 +1,13 @@
 import os
+import hashlib
+import threading
 import tempfile
 import asyncio
-from typing import Callable, Dict, Optional, Union, Any
-from PIL import Image as PILImage
+from typing import FrozenSet, List, Optional, Tuple
 from astrbot import logger
 from ..core.image_render.render_facade import RenderFacade
-from litemapy import Schematic
 from ..utils.config import Config
 from ..utils.exceptions import InvalidViewTypeError, RenderError
-from ..utils.types import ViewType, LayoutType
 
 # 布局类型映射，将命令参数映射到内部布局类型
 LAYOUT_MAPPING = {
@@ -25,12 +24,24 @@ LAYOUT_MAPPING = {
     "c": "custom_combined"
 }
 
+# 支持的视图类型
+VALID_VIEW_TYPES: FrozenSet[str] = frozenset(("top", "front", "north", "side", "east", "south", "west", "combined"))
+
+# 预览图磁盘缓存保留的最大文件数，超出后按最近使用时间淘汰
+PREVIEW_CACHE_MAX_FILES = 64
+
 class RenderManager:
     def __init__(self, config: Config) -> None:
         self.config: Config = config
         self.resource_dir: str = config.get_resource_dir()
         # 创建RenderFacade实例
         self.render_facade: RenderFacade = RenderFacade(resource_dir=self.resource_dir)
+        # 预览图缓存目录
+        temp_dir = config.get_config_value("temp_dir", os.path.join(config.get_plugin_dir(), "temp"))
+        self.preview_cache_dir: str = os.path.join(temp_dir, "preview_cache")
+        os.makedirs(self.preview_cache_dir, exist_ok=True)
+        # 缓存键不包含材质文件内容和渲染器版本，插件重新加载后旧预览图可能已过期，启动时清空
+        self._clear_preview_cache()
     
     def render_litematic(self, file_path: str, view_type: str = "combined", scale: int = 1, 
                          layout: str = "", spacing: int = 0, add_labels: bool = False,
@@ -89,7 +100,7 @@ class RenderManager:
     
     def _sync_render_litematic(self, file_path: str, view_type: str = "combined", scale: int = 1,
                              layout: str = "", spacing: int = 0, add_labels: bool = False,
-                             use_block_models: bool = True) -> str:
+                             use_block_models: bool = True, output_path: Optional[str] = None) -> str:
         """
         同步渲染litematic文件（内部方法）
         
@@ -101,9 +112,10 @@ class RenderManager:
             spacing: 视图间距
             add_labels: 是否添加标签
             use_block_models: 是否使用方块模型
+            output_path: 图像输出路径，为None时写入新建的临时文件
             
         Returns:
-            str: 临时图像文件路径
+            str: 图像文件路径
             
         Raises:
             InvalidViewTypeError: 视图类型不支持时
@@ -112,7 +124,7 @@ class RenderManager:
         try:
             # 检查视图类型
             view_type = view_type.lower()
-            if view_type not in ["top", "front", "north", "side", "east", "south", "west", "combined"]:
+            if view_type not in VALID_VIEW_TYPES:
                 raise InvalidViewTypeError(f"不支持的视图类型: {view_type}")
             
             # 使用RenderFacade加载并渲染
@@ -132,15 +144,16 @@ class RenderManager:
             if image is None:
                 raise RenderError("渲染图像失败", code=1002)
             
-            # 创建临时文件
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                temp_file = tmp.name
+            # 未指定输出路径时创建临时文件
+            if output_path is None:
+                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
+                    output_path = tmp.name
             
             # 保存图像
-            if not self.render_facade.save_image(image, temp_file):
+            if not self.render_facade.save_image(image, output_path):
                 raise RenderError("保存图像失败", code=1003)
             
-            return temp_file
+            return output_path
             
         except InvalidViewTypeError:
             raise
@@ -148,4 +161,156 @@ class RenderManager:
             raise
         except Exception as e:
             logger.error(f"渲染litematic文件失败: {e}")
-            raise RenderError(f"渲染失败: {str(e)}", code=1000) 
\ No newline at end of file
+            raise RenderError(f"渲染失败: {str(e)}", code=1000)
+    
+    async def render_litematic_cached_async(self, file_path: str, view_type: str = "combined", scale: int = 1,
+                                          layout: str = "", spacing: int = 0, add_labels: bool = False,
+                                          use_block_models: bool = True) -> str:
+        """
+        异步渲染litematic文件，相同文件和参数的结果直接复用磁盘缓存
+        
+        此方法是异步的，调用时需要使用await。返回的图像文件属于缓存，调用方不应删除。
+        
+        Args:
+            file_path: litematic文件路径
+            view_type: 视图类型，支持top/front/side/north/south/east/west/combined
+            scale: 缩放比例
+            layout: 布局类型，支持vertical/horizontal/grid/stacked/combined
+            spacing: 视图间距
+            add_labels: 是否添加标签
+            use_block_models: 是否使用方块模型
+            
+        Returns:
+            str: 缓存图像文件路径
+            
+        Raises:
+            InvalidViewTypeError: 视图类型不支持时
+            RenderError: 渲染过程出错时
+        """
+        return await asyncio.to_thread(
+            self._sync_render_litematic_cached, file_path, view_type, scale, layout,
+            spacing, add_labels, use_block_models
+        )
+    
+    def _sync_render_litematic_cached(self, file_path: str, view_type: str = "combined", scale: int = 1,
+                                    layout: str = "", spacing: int = 0, add_labels: bool = False,
+                                    use_block_models: bool = True) -> str:
+        """
+        同步渲染litematic文件并写入磁盘缓存（内部方法）
+        
+        缓存键包含文件路径、修改时间、大小、资源包配置的修改时间以及全部渲染参数，
+        文件被替换或切换材质包后自动失效。
+        
+        Args:
+            file_path: litematic文件路径
+            view_type: 视图类型，支持top/front/side/north/south/east/west/combined
+            scale: 缩放比例
+            layout: 布局类型，支持vertical/horizontal/grid/stacked/combined
+            spacing: 视图间距
+            add_labels: 是否添加标签
+            use_block_models: 是否使用方块模型
+            
+        Returns:
+            str: 缓存图像文件路径
+            
+        Raises:
+            InvalidViewTypeError: 视图类型不支持时
+            RenderError: 渲染过程出错时
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            raise RenderError(f"无法读取litematic文件: {e}", code=1001)
+        
+        # 解析前拒绝超大文件，避免加载时耗尽内存
+        max_size: int = self.config.get_config_value("max_schematic_size_bytes", 64 * 1024 * 1024)
+        if st.st_size > max_size:
+            raise RenderError(f"文件过大（{st.st_size} 字节），超过 {max_size} 字节的上限", code=1004)
+        
+        # 切换材质包会改写resourcepack.json，其修改时间计入缓存键，切换后旧预览图自动失效
+        try:
+            pack_mtime_ns = os.stat(os.path.join(self.resource_dir, "resourcepack.json")).st_mtime_ns
+        except OSError:
+            pack_mtime_ns = 0
+        
+        key_source = (f"{os.path.abspath(file_path)}:{st.st_mtime_ns}:{st.st_size}:{pack_mtime_ns}:"
+                      f"{view_type.lower()}:{scale}:{layout.lower()}:{spacing}:{add_labels}:{use_block_models}")
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=8).hexdigest()
+        cache_path = os.path.join(self.preview_cache_dir, f"{key}.png")
+        
+        # 命中缓存：刷新修改时间用于LRU淘汰，直接返回
+        try:
+            os.utime(cache_path)
+            return cache_path
+        except OSError:
+            pass
+        
+        # 直接渲染到缓存目录中的临时文件再原子替换，避免跨文件系统移动时整文件复制；
+        # 临时文件不以.png结尾，不会被淘汰扫描计入
+        temp_file = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._sync_render_litematic(
+                file_path, view_type, scale, layout, spacing, add_labels, use_block_models,
+                output_path=temp_file
+            )
+        except Exception:
+            # 保存失败时可能留下不完整的临时文件
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            raise
+        try:
+            os.replace(temp_file, cache_path)
+        except OSError as e:
+            # 写入缓存失败时删除临时文件并报错，不留下无人清理的临时文件
+            logger.warning(f"写入预览图缓存失败: {e}")
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            raise RenderError(f"保存图像失败: {e}", code=1003)
+        
+        self._evict_preview_cache()
+        return cache_path
+    
+    def _clear_preview_cache(self) -> None:
+        """删除预览图缓存目录中的所有文件，包括上次运行遗留的临时文件（内部方法）"""
+        try:
+            with os.scandir(self.preview_cache_dir) as it:
+                paths: List[str] = [entry.path for entry in it if entry.name.endswith((".png", ".tmp"))]
+        except OSError:
+            return
+        
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _evict_preview_cache(self) -> None:
+        """按最近使用时间淘汰超出数量上限的预览图缓存（内部方法）"""
+        # 其他线程可能同时在淘汰缓存，文件随时会消失：逐个取修改时间，已不存在的文件直接跳过
+        entries: List[Tuple[int, str]] = []
+        try:
+            with os.scandir(self.preview_cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".png"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        
+        if len(entries) <= PREVIEW_CACHE_MAX_FILES:
+            return
+        
+        entries.sort()
+        for _, path in entries[:len(entries) - PREVIEW_CACHE_MAX_FILES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -27,6 +27,7 @@ from .exceptions import (
 from .logging_utils import (
     log_error, log_exception, log_operation
 )
+from .task_utils import spawn_tracked
 
 __all__ = [
     'Config',
@@ -45,5 +46,7 @@ __all__ = [
     'ConfigError', 'ConfigLoadError', 'ConfigSaveError',
     'InvalidOperationError', 'InvalidArgumentError',
     # 日志工具
-    'log_error', 'log_exception', 'log_operation'
+    'log_error', 'log_exception', 'log_operation',
+    # 任务工具
+    'spawn_tracked'
 ] 
\ No newline at end of file
@@ -41,7 +41,8 @@ class Config:
                 "max_workers": self.astrbot_config.get("max_workers", 3),
                 "resource_dir": os.path.join(self.plugin_dir, "resource"),
                 "use_block_models": self.astrbot_config.get("use_block_models", True),
-                "max_gif_size_bytes": self.astrbot_config.get("max_gif_size_bytes", 5 * 1024 * 1024)
+                "max_gif_size_bytes": self.astrbot_config.get("max_gif_size_bytes", 5 * 1024 * 1024),
+                "max_schematic_size_bytes": self.astrbot_config.get("max_schematic_size_bytes", 64 * 1024 * 1024)
             }
         else:
             # 默认配置（向后兼容）
@@ -52,7 +53,8 @@ class Config:
                 "max_workers": 3,
                 "resource_dir": os.path.join(self.plugin_dir, "resource"),
                 "use_block_models": True,  # 默认启用方块模型
-                "max_gif_size_bytes": 5 * 1024 * 1024  # 最大GIF文件大小（字节），默认5MB
+                "max_gif_size_bytes": 5 * 1024 * 1024,  # 最大GIF文件大小（字节），默认5MB
+                "max_schematic_size_bytes": 64 * 1024 * 1024  # 可分析/渲染的最大投影文件大小（字节），默认64MB
             }
         
         # 创建临时目录
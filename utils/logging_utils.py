@@ -21,6 +21,7 @@ def log_error(error: Union[LitematicPluginError, Exception],
     """
     # 准备日志信息
     log_info = {}
+    exc_info: Optional[BaseException] = None
     
     # 添加额外信息
     if extra_info:
@@ -55,13 +56,13 @@ def log_error(error: Union[LitematicPluginError, Exception],
         error_message = str(error)
         log_message = f"[{error_type}] {error_message}"
         
-        # 添加堆栈信息
+        # 添加堆栈信息 - 通过exc_info交给日志处理器按需格式化，日志被过滤时不会展开堆栈
         if level >= logging.ERROR:
-            log_info['traceback'] = traceback.format_exc()
+            exc_info = error
     
     # 根据日志级别记录
     if level >= logging.ERROR:
-        logger.error(log_message, extra=log_info)
+        logger.error(log_message, extra=log_info, exc_info=exc_info)
     elif level >= logging.WARNING:
         logger.warning(log_message, extra=log_info)
     elif level >= logging.INFO:
@@ -82,14 +83,15 @@ def log_exception(exc_type: Type[Exception], exc_value: Exception,
         extra_info: 额外信息
     """
     log_info = {
-        'exc_type': exc_type.__name__,
-        'traceback': ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        'exc_type': exc_type.__name__
     }
     
     if extra_info:
         log_info.update(extra_info)
     
-    logger.error(f"未捕获的异常: {exc_value}", extra=log_info)
+    # 堆栈通过exc_info交给日志处理器格式化，日志被过滤时不会展开
+    logger.error(f"未捕获的异常: {exc_value}", extra=log_info,
+                 exc_info=(exc_type, exc_value, exc_traceback))
 
 
 def log_operation(operation: str, success: bool, details: Optional[Dict[str, Any]] = None) -> None:
@@ -0,0 +1,26 @@
+"""
+后台任务工具模块，统一管理需要保持引用的asyncio任务
+"""
+import asyncio
+from typing import Any, Coroutine, Set, TypeVar
+
+T = TypeVar("T")
+
+# 进行中的后台任务，保持强引用直到完成；事件循环只持有任务的弱引用，
+# 命令提前结束时没有其他引用的任务可能被垃圾回收
+_tracked_tasks: Set[asyncio.Task] = set()
+
+
+def spawn_tracked(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """创建任务并保持引用直到任务完成
+    
+    Args:
+        coro: 要执行的协程
+        
+    Returns:
+        asyncio.Task[T]: 创建的任务，调用方可以继续等待
+    """
+    task = asyncio.create_task(coro)
+    _tracked_tasks.add(task)
+    task.add_done_callback(_tracked_tasks.discard)
+    return task
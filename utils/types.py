@@ -18,7 +18,7 @@ BlockMap = Dict[int, Dict[int, Dict[int, Any]]]  # 三维坐标索引到方块
 class UploadStatus(TypedDict):
     """上传状态类型定义"""
     category: str
-    expire_time: float
+    expire_time: float  # 过期时间，基于time.monotonic()
 
 UserKey = str  # 用户标识，通常为 session_id + sender_id
 